@@ -5,12 +5,23 @@ Works with results from run_symbolic_executor.py (result/llm/<util>_symbolic_cov
 """
 
 import argparse
+import hashlib
 import json
+import mmap
+import os
 import re
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 WORKSPACE_ROOT = Path(__file__).parent.resolve()
@@ -18,10 +29,77 @@ DEFAULT_RESULT_DIR = WORKSPACE_ROOT / "result" / "llm"
 DEFAULT_COVERAGE_SUBDIR_GLOB = "*_symbolic_coverage"
 DEFAULT_OUTPUT_DIR = WORKSPACE_ROOT / "result" / "llm" / "merged-coverage"
 
+# Below this many .gcov.txt files, parse in-process (pool startup costs more than it saves).
+_PARALLEL_PARSE_MIN_FILES = 64
+
+# Max .info files per lcov -a ... invocation; larger merges are done in parallel chunks.
+_LCOV_MERGE_CHUNK = 32
+
+# Reports larger than this are scanned through mmap instead of a buffered text file.
+_GCOV_MMAP_MIN_BYTES = 1 << 20
+
+# Side file in the aggregation output dir caching parsed reports by (mtime_ns, size).
+_GCOV_CACHE_NAME = ".gcov_cache.json"
+_GCOV_CACHE_VERSION = 1
+
+# Merged .info of a fixed set of coverage dirs, cached in an output dir as <prefix><key>.info.
+_MERGED_INFO_CACHE_PREFIX = ".merged_base_"
+
+# Shared "branches" value for gcovr line entries (serialized as []); we never emit branch data.
+_EMPTY_BRANCHES = ()
+
+# gcov writes the Source: line in the first few header lines of every report.
+_GCOV_HEADER_MAX_LINES = 64
+
+# Characters allowed in the gcov execution-count column (counts, "-" and "#####").
+_GCOV_COUNT_CHARS = "-0123456789#"
+
+# Compiled once: these run per line of gcovr / lcov reports.
+_MISSING_HEADER_RE = re.compile(r"\s+Missing\s*$")
+_MISSING_DATA_RE = re.compile(r"(\s+\d+%)\s+[\d,\s\-]+$")
+_MISSING_DATA_SEARCH_RE = re.compile(r"\d+%\s+[\d,\s\-]+$")
+
+
+# A gcov report given as its text, a path to stream it from, or an iterable of lines.
+GcovInput = Union[str, Path, Iterable[str]]
+
+
+def _iter_gcov_lines(path: Path) -> Iterator[str]:
+    """Yield the lines of a gcov report one at a time (without newlines) instead of reading it whole."""
+    if path.stat().st_size >= _GCOV_MMAP_MIN_BYTES:
+        yield from _iter_gcov_lines_mmap(path)
+        return
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def _iter_gcov_lines_mmap(path: Path) -> Iterator[str]:
+    """Like _iter_gcov_lines, but lets the kernel page a large report in lazily via mmap."""
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for raw in iter(mm.readline, b""):
+            if raw.endswith(b"\r\n"):
+                raw = raw[:-2]
+            elif raw.endswith(b"\n"):
+                raw = raw[:-1]
+            yield raw.decode("utf-8", "replace")
+
+
+def _gcov_lines(content: GcovInput) -> Iterable[str]:
+    """Lines of a gcov report given as text, a path (streamed), or an iterable of lines."""
+    if isinstance(content, str):
+        return content.split("\n")
+    if isinstance(content, Path):
+        return _iter_gcov_lines(content)
+    return (line.rstrip("\n") for line in content)
+
 
-def parse_gcov_source_path(content: str) -> Optional[str]:
-    """Extract source file path from gcov content (line like '    -:    0:Source:../src/cat.c')."""
-    for line in content.split("\n"):
+def parse_gcov_source_path(content: GcovInput) -> Optional[str]:
+    """
+    Extract source file path from gcov content (line like '    -:    0:Source:../src/cat.c').
+    Stops at the first Source: line, so a streamed file is only read up to its header.
+    """
+    for line in _gcov_lines(content):
         if ":Source:" in line:
             idx = line.find("Source:")
             if idx != -1:
@@ -29,17 +107,48 @@ def parse_gcov_source_path(content: str) -> Optional[str]:
     return None
 
 
-def parse_gcov_coverage(content: str) -> Dict[int, int]:
+def parse_gcov_source_path_from_path(path: Path) -> Optional[str]:
+    """Extract the Source: path from the header of a gcov file without reading the rest of it."""
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        for _ in range(_GCOV_HEADER_MAX_LINES):
+            line = f.readline()
+            if not line:
+                break
+            if ":Source:" in line:
+                idx = line.find("Source:")
+                return line[idx + 7 :].strip()
+    return None
+
+
+def parse_gcov_both(
+    content: GcovInput,
+    want_lines: bool = True,
+) -> Tuple[Dict[int, int], List[Tuple[str, int, str]]]:
     """
-    Parse gcov file. Returns dict mapping line_number -> execution_count.
-    Non-executable lines (-) are skipped. ##### -> 0, number -> number.
+    Parse gcov file (text, path or lines) in one pass into (coverage, lines).
+    coverage is as returned by parse_gcov_coverage, lines as by parse_gcov_lines
+    (left empty when want_lines is False).
     """
     coverage = {}
-    for line in content.split("\n"):
-        m = re.match(r"^\s*([-0-9#]+):\s*(\d+):", line)
-        if not m:
+    lines_out = []
+    append = lines_out.append
+    count_chars = _GCOV_COUNT_CHARS
+    # Data lines are '<count>:<line_num>:<source>'; the split is inlined since this is the hot loop.
+    for line in _gcov_lines(content):
+        cov_str, sep, tail = line.partition(":")
+        cov_str = cov_str.strip()
+        if cov_str == "-" and not want_lines:
+            continue  # non-executable, and its line number is not needed
+        num_str, sep2, rest = tail.partition(":")
+        num_str = num_str.lstrip()
+        if not (sep and sep2 and cov_str) or cov_str.strip(count_chars) or not num_str.isdecimal():
+            # Not a data line (e.g. '------------------' separators)
+            if want_lines:
+                append(("-", 0, line))  # keep unparseable as-is
             continue
-        cov_str, line_num = m.group(1).strip(), int(m.group(2))
+        line_num = int(num_str)
+        if want_lines:
+            append((cov_str, line_num, rest))
         if cov_str == "-":
             continue  # non-executable
         if cov_str == "#####":
@@ -49,59 +158,203 @@ def parse_gcov_coverage(content: str) -> Dict[int, int]:
                 coverage[line_num] = int(cov_str)
             except ValueError:
                 coverage[line_num] = 0
-    return coverage
+    return coverage, lines_out
 
 
-def parse_gcov_lines(content: str) -> List[Tuple[str, int, str]]:
+def parse_gcov_coverage(content: GcovInput) -> Dict[int, int]:
     """
-    Parse gcov file line by line. Returns list of (count_str, line_num, rest) preserving order.
-    count_str is the gcov prefix (-, #####, or number); rest is the part after "line_num:".
+    Parse gcov file (text, path or lines). Returns dict mapping line_number -> execution_count.
+    Non-executable lines (-) are skipped. ##### -> 0, number -> number.
     """
-    lines_out = []
-    for line in content.split("\n"):
-        m = re.match(r"^(\s*)([-0-9#]+)(\s*):\s*(\d+):(.*)$", line)
-        if not m:
-            lines_out.append(("-", 0, line))  # keep unparseable as-is
+    return parse_gcov_both(content, want_lines=False)[0]
+
+
+def parse_gcov_lines(content: GcovInput) -> List[Tuple[str, int, str]]:
+    """
+    Parse gcov file (text, path or lines) line by line. Returns list of (count_str, line_num, rest)
+    preserving order. count_str is the gcov prefix (-, #####, or number); rest is the part after "line_num:".
+    """
+    return parse_gcov_both(content)[1]
+
+
+class _ParsedGcov(NamedTuple):
+    """
+    A .gcov.txt report read once: its Source: path and line -> execution count map.
+    template holds its parse_gcov_lines() output when it was captured in the same pass
+    (first report of each source), so write_cumulative_gcov need not re-read the file.
+    """
+
+    path: Path
+    source: Optional[str]
+    coverage: Dict[int, int]
+    template: Optional[List[Tuple[str, int, str]]] = None
+
+
+def _source_key(source: Optional[str]) -> str:
+    """Grouping key for a report's Source: path."""
+    return (source or "unknown.c").replace("\\", "/").strip()
+
+
+def _is_c_source(source: Optional[str]) -> bool:
+    return bool(source) and source.endswith(".c")
+
+
+def _is_c_report(report: _ParsedGcov) -> bool:
+    return _is_c_source(report.source)
+
+
+def _parse_gcov_report(path: Path, only_c_sources: bool = False, seen: Optional[set] = None) -> _ParsedGcov:
+    """
+    Parse one .gcov.txt report, streaming it rather than holding its whole text in memory.
+    If seen is given, the template (line list) is captured in the same pass when the report's
+    source is not in seen yet, and the source is added to it. With only_c_sources, a report whose
+    header names a non-.c source is returned with empty coverage without reading past the header.
+    """
+    source = parse_gcov_source_path_from_path(path)
+    if only_c_sources and not _is_c_source(source):
+        return _ParsedGcov(path, source, {})
+    key = _source_key(source)
+    want_template = seen is not None and key not in seen
+    if seen is not None:
+        seen.add(key)
+    coverage, lines = parse_gcov_both(path, want_lines=want_template)
+    return _ParsedGcov(path, source, coverage, lines if want_template else None)
+
+
+def _parse_gcov_chunk(paths: List[Path], only_c_sources: bool = False) -> List[_ParsedGcov]:
+    """
+    Parse .gcov.txt reports in order. The template of the first report of each source is
+    captured in the same pass.
+    """
+    seen = set()
+    return [_parse_gcov_report(path, only_c_sources, seen) for path in paths]
+
+
+def _parse_gcov_files(
+    paths: List[Path],
+    jobs: Optional[int] = None,
+    only_c_sources: bool = False,
+) -> List[_ParsedGcov]:
+    """
+    Parse .gcov.txt files, preserving order. Large batches are spread over a process pool
+    of `jobs` workers (default: os.cpu_count()); jobs <= 1 parses in-process.
+    Reports parsed in the pool carry no template; merging re-reads it from the first report.
+    """
+    if (jobs is not None and jobs <= 1) or len(paths) < _PARALLEL_PARSE_MIN_FILES:
+        return _parse_gcov_chunk(paths, only_c_sources)
+    parse = partial(_parse_gcov_report, only_c_sources=only_c_sources)
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        return list(ex.map(parse, paths, chunksize=16))
+
+
+def _load_gcov_cache(cache_path: Path) -> Dict[str, list]:
+    """Load the parsed-report cache: {path: [mtime_ns, size, source, [ln, count, ln, count, ...]]}."""
+    try:
+        data = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _GCOV_CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _parse_gcov_files_cached(
+    paths: List[Path],
+    cache_path: Path,
+    jobs: Optional[int] = None,
+    only_c_sources: bool = False,
+) -> List[_ParsedGcov]:
+    """
+    Like _parse_gcov_files, but reuses results from cache_path for reports whose mtime and size
+    are unchanged, parses only the rest, and rewrites the cache for this set of paths.
+    """
+    cache = _load_gcov_cache(cache_path)
+    results: List[Optional[_ParsedGcov]] = [None] * len(paths)
+    stamps: List[Optional[Tuple[int, int]]] = [None] * len(paths)
+    misses: List[int] = []
+    for i, path in enumerate(paths):
+        try:
+            st = path.stat()
+        except OSError:
+            misses.append(i)
+            continue
+        stamps[i] = (st.st_mtime_ns, st.st_size)
+        entry = cache.get(str(path))
+        if entry is not None and (entry[0], entry[1]) == stamps[i]:
+            it = iter(entry[3])
+            results[i] = _ParsedGcov(path, entry[2], dict(zip(it, it)))
+        else:
+            misses.append(i)
+    for i, report in zip(misses, _parse_gcov_files([paths[i] for i in misses], jobs=jobs, only_c_sources=only_c_sources)):
+        results[i] = report
+
+    new_cache: Dict[str, list] = {}
+    for report, stamp in zip(results, stamps):
+        # Reports skipped at the header (non-.c with only_c_sources) have no coverage to cache.
+        if stamp is None or (only_c_sources and not _is_c_report(report)):
             continue
-        _lead, count_str, _gap, line_num, rest = m.groups()
-        lines_out.append((count_str.strip(), int(line_num), rest))
-    return lines_out
+        flat = [v for item in report.coverage.items() for v in item]
+        new_cache[str(report.path)] = [stamp[0], stamp[1], report.source, flat]
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(_json_bytes({"version": _GCOV_CACHE_VERSION, "files": new_cache}))
+    except OSError:
+        pass
+    return results
+
+
+def _load_gcov_dir(
+    gcov_dir: Path,
+    only_c_sources: bool = True,
+    jobs: Optional[int] = None,
+) -> List[_ParsedGcov]:
+    """
+    Parse every .gcov.txt in gcov_dir (sorted by name).
+    If only_c_sources is True, drop reports whose Source: path does not end with .c.
+    """
+    reports = _parse_gcov_files(sorted(gcov_dir.glob("*.gcov.txt")), jobs=jobs, only_c_sources=only_c_sources)
+    if only_c_sources:
+        reports = [r for r in reports if _is_c_report(r)]
+    return reports
 
 
 def write_cumulative_gcov(
-    gcov_paths: List[Path],
+    reports: List[_ParsedGcov],
     output_path: Path,
 ) -> bool:
     """
-    Merge all gcov files into a single cumulative report.
+    Merge parsed gcov reports into a single cumulative report.
     A line is marked "+" if covered by any report (count > 0); otherwise "#####" if executable, "-" if not.
-    Uses the first file as the template for line order and source text.
+    Uses the first report as the template for line order and source text (re-read only if its
+    template was not captured while parsing).
     """
-    if not gcov_paths:
+    if not reports:
         return False
-    merged_covered: set[int] = set()
-    merged_executable: set[int] = set()
-    template_lines: List[Tuple[str, int, str]] = []
-    for p in gcov_paths:
-        if not p.exists():
-            continue
-        content = p.read_text(encoding="utf-8", errors="replace")
-        cov = parse_gcov_coverage(content)
-        for line_num, count in cov.items():
-            merged_executable.add(line_num)
+    # One byte per line number instead of set[int] entries; sized to the largest line seen.
+    size = max((max(report.coverage, default=0) for report in reports), default=0) + 1
+    merged_covered = bytearray(size)
+    merged_executable = bytearray(size)
+    for report in reports:
+        for line_num, count in report.coverage.items():
+            merged_executable[line_num] = 1
             if count > 0:
-                merged_covered.add(line_num)
-        if not template_lines:
-            template_lines = parse_gcov_lines(content)
+                merged_covered[line_num] = 1
+    template_lines = reports[0].template
+    if template_lines is None:
+        try:
+            template_lines = parse_gcov_lines(reports[0].path)
+        except OSError:
+            return False
     if not template_lines:
         return False
     out_lines = []
     for count_str, line_num, rest in template_lines:
         if count_str == "-":
             prefix = "        -"
-        elif line_num in merged_covered:
+        elif line_num < size and merged_covered[line_num]:
             prefix = "        +"
-        elif line_num in merged_executable:
+        elif line_num < size and merged_executable[line_num]:
             prefix = "    #####"
         else:
             prefix = "        -"
@@ -114,21 +367,43 @@ def write_cumulative_gcov(
 def gcov_to_lcov_info(content: str, source_path: Optional[str]) -> str:
     """Convert gcov text to lcov .info content. SF + DA lines + end_of_record."""
     path = source_path or parse_gcov_source_path(content) or "unknown.c"
-    cov = parse_gcov_coverage(content)
+    return _coverage_to_lcov_info(path, parse_gcov_coverage(content))
+
+
+def _coverage_to_lcov_info(path: str, cov: Dict[int, int]) -> str:
+    """Build lcov .info content for one source from its line -> count map."""
     lines = [f"SF:{path}"]
-    for ln in sorted(cov.keys()):
-        lines.append(f"DA:{ln},{cov[ln]}")
+    lines.extend(map("DA:%d,%d".__mod__, sorted(cov.items())))
     lines.append("end_of_record")
     return "\n".join(lines)
 
 
+def _json_bytes(obj) -> bytes:
+    """Serialize obj to compact JSON bytes (orjson when installed, else stdlib json)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
 def normalize_gcovr_file_path(source_path: str, workspace_root: Path) -> str:
     """Convert gcov source path (e.g. ../src/cat.c from obj-gcov) to path relative to workspace_root."""
     if not source_path or source_path == "unknown.c":
         return source_path or "unknown.c"
-    obj_gcov = workspace_root / "coreutils" / "coreutils-8.32" / "obj-gcov"
+    return _normalize_gcovr_file_path(source_path, str(workspace_root))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_gcovr_file_path(source_path: str, workspace_root: str) -> str:
+    """
+    Cached worker for normalize_gcovr_file_path; the same few sources recur in every gcov dir.
+    ../src/foo.c from obj-gcov only needs lexical normalization, so abspath is tried first and
+    resolve() (which walks symlinks) is only used when that path does not exist.
+    """
+    obj_gcov = os.path.join(workspace_root, "coreutils", "coreutils-8.32", "obj-gcov")
     try:
-        resolved = (obj_gcov / source_path).resolve()
+        resolved = Path(os.path.abspath(os.path.join(obj_gcov, source_path)))
+        if not resolved.exists():
+            resolved = Path(obj_gcov, source_path).resolve()
         return str(resolved.relative_to(workspace_root)).replace("\\", "/")
     except (ValueError, OSError):
         return source_path
@@ -142,15 +417,19 @@ def gcov_to_gcovr_json(
     """Convert gcov text to gcovr JSON tracefile (format_version 0.14)."""
     raw_path = source_path or parse_gcov_source_path(content) or "unknown.c"
     path = normalize_gcovr_file_path(raw_path, workspace_root) if workspace_root else raw_path
-    cov = parse_gcov_coverage(content)
+    return _coverage_to_gcovr_json(path, parse_gcov_coverage(content))
+
+
+def _coverage_to_gcovr_json(path: str, cov: Dict[int, int]) -> Dict:
+    """Build a gcovr JSON tracefile for one source from its line -> count map."""
     line_entries = [
         {
             "line_number": ln,
             "function_name": "",
-            "count": cov[ln],
-            "branches": [],
+            "count": count,
+            "branches": _EMPTY_BRANCHES,
         }
-        for ln in sorted(cov.keys())
+        for ln, count in sorted(cov.items())
     ]
     return {
         "gcovr/format_version": "0.14",
@@ -170,38 +449,63 @@ def convert_dir_to_tracefiles(
     base_name: str = "trace",
     workspace_root: Optional[Path] = None,
     only_c_sources: bool = True,
+    reports: Optional[List[_ParsedGcov]] = None,
+    emit_info: bool = True,
+    emit_json: bool = True,
 ) -> Tuple[List[Path], List[Path]]:
     """
     Convert .gcov.txt in gcov_dir to .info and .json in out_dir.
     If only_c_sources is True (default), only convert files whose Source: path ends with .c.
+    Pass reports (from _load_gcov_dir) to reuse already-parsed files instead of reading gcov_dir.
+    emit_info / emit_json turn off building and writing the lcov / gcovr output.
     Returns (list of .info paths, list of .json paths).
     """
     out_dir.mkdir(parents=True, exist_ok=True)
-    gcov_files = sorted(gcov_dir.glob("*.gcov.txt"))
+    if reports is None:
+        reports = _load_gcov_dir(gcov_dir, only_c_sources=only_c_sources)
     info_paths = []
     json_paths = []
-    idx = 0
-    for gcov_path in gcov_files:
-        content = gcov_path.read_text(encoding="utf-8", errors="replace")
-        source_path = parse_gcov_source_path(content)
-        if only_c_sources and (not source_path or not source_path.endswith(".c")):
-            continue
-        info_content = gcov_to_lcov_info(content, source_path)
-        info_path = out_dir / f"{base_name}_{idx:05d}.info"
-        info_path.write_text(info_content, encoding="utf-8")
-        info_paths.append(info_path)
-        j = gcov_to_gcovr_json(content, source_path, workspace_root)
-        json_path = out_dir / f"{base_name}_{idx:05d}.json"
-        json_path.write_text(json.dumps(j), encoding="utf-8")
-        json_paths.append(json_path)
-        idx += 1
+    for idx, report in enumerate(reports):
+        raw_path = report.source or "unknown.c"
+        if emit_info:
+            info_content = _coverage_to_lcov_info(raw_path, report.coverage)
+            info_path = out_dir / f"{base_name}_{idx:05d}.info"
+            info_path.write_text(info_content, encoding="utf-8")
+            info_paths.append(info_path)
+        if emit_json:
+            json_file = normalize_gcovr_file_path(raw_path, workspace_root) if workspace_root else raw_path
+            j = _coverage_to_gcovr_json(json_file, report.coverage)
+            json_path = out_dir / f"{base_name}_{idx:05d}.json"
+            json_path.write_bytes(_json_bytes(j))
+            json_paths.append(json_path)
     return info_paths, json_paths
 
 
-def merge_lcov(info_paths: List[Path], merged_path: Path) -> Optional[bool]:
-    """Merge lcov .info files: lcov -a f1.info -a f2.info ... -o merged.info. Returns None if lcov not installed."""
+def merge_lcov(info_paths: List[Path], merged_path: Path, jobs: Optional[int] = None) -> Optional[bool]:
+    """
+    Merge lcov .info files: lcov -a f1.info -a f2.info ... -o merged.info. Returns None if lcov not installed.
+    More than _LCOV_MERGE_CHUNK files are merged in chunks (up to `jobs` lcov processes at once,
+    default os.cpu_count()) and the chunk results are then merged, keeping each argv short.
+    """
     if not info_paths:
         return False
+    if len(info_paths) <= _LCOV_MERGE_CHUNK:
+        return _run_lcov_merge(info_paths, merged_path)
+    chunks = [info_paths[i : i + _LCOV_MERGE_CHUNK] for i in range(0, len(info_paths), _LCOV_MERGE_CHUNK)]
+    merged_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="lcov-merge-", dir=merged_path.parent) as tmp:
+        chunk_paths = [Path(tmp) / f"chunk_{i:05d}.info" for i in range(len(chunks))]
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as ex:
+            results = list(ex.map(_run_lcov_merge, chunks, chunk_paths))
+        if any(r is None for r in results):
+            return None
+        if not all(results):
+            return False
+        return merge_lcov(chunk_paths, merged_path, jobs=jobs)
+
+
+def _run_lcov_merge(info_paths: List[Path], merged_path: Path) -> Optional[bool]:
+    """Run a single lcov -a ... -o merged_path. Returns None if lcov not installed."""
     args = []
     for p in info_paths:
         args.extend(["-a", str(p)])
@@ -236,35 +540,77 @@ def summary_lcov(merged_path: Path) -> bool:
     return True
 
 
+def _lcov_line_totals_from_info(path: Path) -> Tuple[int, int]:
+    """
+    Sum (lines found, lines hit) over all records of an lcov .info file.
+    Uses a record's LF:/LH: totals when present, else counts its DA: lines.
+    """
+    lf = lh = 0
+    rec_lf = rec_lh = None
+    da_found = da_hit = 0
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("DA:"):
+                parts = line[3:].split(",")
+                if len(parts) >= 2:
+                    da_found += 1
+                    try:
+                        if int(parts[1]) > 0:
+                            da_hit += 1
+                    except ValueError:
+                        pass
+            elif line.startswith("LF:"):
+                rec_lf = int(line[3:])
+            elif line.startswith("LH:"):
+                rec_lh = int(line[3:])
+            elif line.startswith("end_of_record"):
+                lf += rec_lf if rec_lf is not None else da_found
+                lh += rec_lh if rec_lh is not None else da_hit
+                rec_lf = rec_lh = None
+                da_found = da_hit = 0
+    return lf, lh
+
+
 def get_lcov_line_coverage_pct(merged_path: Path) -> Optional[float]:
-    """Run lcov --summary on merged.info and return line coverage percentage, or None on failure."""
-    r = subprocess.run(
-        ["lcov", "--summary", str(merged_path)],
-        capture_output=True,
-        text=True,
-        timeout=10,
-    )
-    if r.returncode != 0:
-        return None
-    m = re.search(r"lines\s*\.+:\s*([\d.]+)%", r.stdout)
-    if not m:
-        return None
+    """
+    Return the line coverage percentage of merged.info (rounded like lcov --summary), or None on failure.
+    Parses the tracefile in-process instead of spawning lcov.
+    """
     try:
-        return float(m.group(1))
-    except ValueError:
+        lf, lh = _lcov_line_totals_from_info(merged_path)
+    except (OSError, ValueError):
+        return None
+    if not lf:
         return None
+    return round(100.0 * lh / lf, 1)
 
 
 def get_merged_line_coverage_pct(
     results_dirs: List[Path],
     workspace_root: Path,
     output_dir: Path,
+    base_info: Optional[Path] = None,
 ) -> Optional[float]:
     """
     Convert results_dirs to tracefiles, merge with lcov, return line coverage percentage.
     Uses unique base names per dir so multiple dirs with the same name do not overwrite.
+    base_info (e.g. from cached_merged_info) is an already-merged .info added to the merge,
+    so the dirs it covers need not be passed (and re-parsed) again.
     """
-    all_info = []
+    merged_info = _merge_dirs_to_info(results_dirs, workspace_root, output_dir, base_info=base_info)
+    if merged_info is None:
+        return None
+    return get_lcov_line_coverage_pct(merged_info)
+
+
+def _merge_dirs_to_info(
+    results_dirs: List[Path],
+    workspace_root: Path,
+    output_dir: Path,
+    base_info: Optional[Path] = None,
+) -> Optional[Path]:
+    """Convert results_dirs to tracefiles in output_dir and merge them (plus base_info) into output_dir/merged.info."""
+    all_info = [base_info] if base_info is not None else []
     for idx, res_dir in enumerate(results_dirs):
         if not res_dir.exists():
             continue
@@ -275,6 +621,7 @@ def get_merged_line_coverage_pct(
             output_dir,
             base_name=base,
             workspace_root=workspace_root,
+            emit_json=False,
         )
         all_info.extend(info_paths)
     if not all_info:
@@ -282,7 +629,55 @@ def get_merged_line_coverage_pct(
     merged_info = output_dir / "merged.info"
     if not merge_lcov(all_info, merged_info):
         return None
-    return get_lcov_line_coverage_pct(merged_info)
+    return merged_info
+
+
+def _coverage_dirs_key(results_dirs: List[Path]) -> str:
+    """Hash the dir paths and the name, mtime and size of every .gcov.txt in them."""
+    h = hashlib.blake2b(digest_size=16)
+    for res_dir in results_dirs:
+        h.update(f"{res_dir.resolve()}\0".encode("utf-8", "surrogateescape"))
+        try:
+            entries = sorted(
+                (e for e in os.scandir(res_dir) if e.name.endswith(".gcov.txt")),
+                key=lambda e: e.name,
+            )
+        except OSError:
+            continue
+        for e in entries:
+            try:
+                st = e.stat()
+            except OSError:
+                continue
+            h.update(f"{e.name}\0{st.st_mtime_ns}\0{st.st_size}\n".encode("utf-8", "surrogateescape"))
+    return h.hexdigest()
+
+
+def cached_merged_info(
+    results_dirs: List[Path],
+    workspace_root: Path,
+    cache_dir: Path,
+) -> Optional[Path]:
+    """
+    Return an lcov .info merging results_dirs, reusing the copy cached in cache_dir while none of
+    their .gcov.txt files changed (keyed by path, mtime and size). Older cached merges are removed.
+    Returns None if nothing could be merged (no reports, or lcov not installed).
+    """
+    cached = cache_dir / f"{_MERGED_INFO_CACHE_PREFIX}{_coverage_dirs_key(results_dirs)}.info"
+    if cached.is_file():
+        return cached
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="agg_base_", dir=cache_dir) as tmp:
+        merged_info = _merge_dirs_to_info(results_dirs, workspace_root, Path(tmp))
+        if merged_info is None:
+            return None
+        for stale in cache_dir.glob(f"{_MERGED_INFO_CACHE_PREFIX}*.info"):
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+        os.replace(merged_info, cached)
+    return cached
 
 
 def _strip_gcovr_missing_column(text: str) -> str:
@@ -290,12 +685,12 @@ def _strip_gcovr_missing_column(text: str) -> str:
     lines = text.split("\n")
     out = []
     for line in lines:
-        stripped = line.strip()
-        if "Missing" in line and stripped.startswith("File"):
-            out.append(re.sub(r"\s+Missing\s*$", "", line).rstrip())
-        elif re.search(r"\d+%\s+[\d,\s\-]+$", line):
+        # Cheap substring checks first: most lines need neither regex.
+        if "Missing" in line and line.lstrip().startswith("File"):
+            out.append(_MISSING_HEADER_RE.sub("", line).rstrip())
+        elif "%" in line and _MISSING_DATA_SEARCH_RE.search(line):
             # Data/TOTAL line: drop trailing Missing column (digits, commas, ranges)
-            out.append(re.sub(r"(\s+\d+%)\s+[\d,\s\-]+$", r"\1", line).rstrip())
+            out.append(_MISSING_DATA_RE.sub(r"\1", line).rstrip())
         else:
             out.append(line)
     return "\n".join(out)
@@ -343,17 +738,34 @@ def aggregate_directories(
     output_dir: Path,
     use_lcov: bool = True,
     use_gcovr: bool = True,
+    jobs: Optional[int] = None,
 ) -> bool:
     """
     Collect all .gcov.txt from results_dirs, convert to tracefiles, merge, print summary.
+    Reports from all dirs are parsed together, in parallel across `jobs` processes.
     """
-    all_info = []
-    all_json = []
-    all_gcov_paths: List[Path] = []
+    dir_paths: List[Tuple[int, Path, List[Path]]] = []
     for idx, res_dir in enumerate(results_dirs):
         if not res_dir.exists():
             continue
         res_dir = res_dir.resolve()
+        dir_paths.append((idx, res_dir, sorted(res_dir.glob("*.gcov.txt"))))
+    # Each .gcov.txt is read once; the parsed reports feed both the tracefiles and the cumulative reports.
+    # Unchanged reports (same mtime and size as the last run into output_dir) come from the cache.
+    parsed = iter(
+        _parse_gcov_files_cached(
+            [p for _, _, paths in dir_paths for p in paths],
+            output_dir / _GCOV_CACHE_NAME,
+            jobs=jobs,
+            only_c_sources=True,
+        )
+    )
+
+    all_info = []
+    all_json = []
+    all_reports: List[_ParsedGcov] = []
+    for idx, res_dir, paths in dir_paths:
+        reports = [r for r in (next(parsed) for _ in paths) if _is_c_report(r)]
         # Unique base so multiple dirs with same name (e.g. cat_symbolic_coverage and
         # targeted_uncovered_cat_manual/cat_symbolic_coverage) do not overwrite each other.
         base = f"{idx:04d}_{res_dir.name}".replace("-", "_")
@@ -363,42 +775,39 @@ def aggregate_directories(
             base_name=base,
             workspace_root=workspace_root,
             only_c_sources=True,
+            reports=reports,
+            emit_info=use_lcov,
+            emit_json=use_gcovr,
         )
         all_info.extend(info_paths)
         all_json.extend(json_paths)
-        for p in sorted(res_dir.glob("*.gcov.txt")):
-            try:
-                src = parse_gcov_source_path(p.read_text(encoding="utf-8", errors="replace"))
-                if src and src.endswith(".c"):
-                    all_gcov_paths.append(p)
-            except Exception:
-                pass
+        all_reports.extend(reports)
 
-    if not all_info and not all_json:
+    if not all_reports:
         print("No .gcov.txt files found.", file=sys.stderr)
         return False
 
     # Per-source: only .c files get their own directory and merged cumulative report
-    by_source = group_gcov_paths_by_source(all_gcov_paths)
-    for source_key, paths in sorted(by_source.items()):
+    by_source = group_gcov_paths_by_source(all_reports)
+    for source_key, source_reports in sorted(by_source.items()):
         if not source_key.endswith(".c"):
             continue
         dir_name = _source_to_dirname(source_key)
         source_out_dir = output_dir / dir_name
         source_out_dir.mkdir(parents=True, exist_ok=True)
         cumulative_path = source_out_dir / "cumulative.gcov.txt"
-        if write_cumulative_gcov(paths, cumulative_path):
-            print(f"  {dir_name}/cumulative.gcov.txt ({len(paths)} runs)")
+        if write_cumulative_gcov(source_reports, cumulative_path):
+            print(f"  {dir_name}/cumulative.gcov.txt ({len(source_reports)} runs)")
 
     # Global cumulative (all sources merged into one report) for backward compatibility
     global_cumulative_path = output_dir / "cumulative.gcov.txt"
-    if write_cumulative_gcov(all_gcov_paths, global_cumulative_path):
+    if write_cumulative_gcov(all_reports, global_cumulative_path):
         print(f"Global cumulative: {global_cumulative_path}")
 
     ok = True
     if use_lcov and all_info:
         merged_info = output_dir / "merged.info"
-        lcov_result = merge_lcov(all_info, merged_info)
+        lcov_result = merge_lcov(all_info, merged_info, jobs=jobs)
         if lcov_result is None:
             sys.stderr.write("lcov not installed, skipping lcov merge/summary (install lcov)\n")
         elif lcov_result:
@@ -428,21 +837,14 @@ def _source_to_dirname(source_path: str) -> str:
     return s.replace("/", "_").strip("_") or "unknown"
 
 
-def group_gcov_paths_by_source(gcov_paths: List[Path]) -> Dict[str, List[Path]]:
-    """Group .gcov.txt paths by source file (from Source: line in content). Returns dict source_key -> [paths]."""
-    groups: Dict[str, List[Path]] = {}
-    for p in gcov_paths:
-        if not p.exists():
-            continue
-        try:
-            content = p.read_text(encoding="utf-8", errors="replace")
-            source = parse_gcov_source_path(content) or "unknown.c"
-            key = source.replace("\\", "/").strip()
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(p)
-        except Exception:
-            pass
+def group_gcov_paths_by_source(reports: List[_ParsedGcov]) -> Dict[str, List[_ParsedGcov]]:
+    """Group parsed .gcov.txt reports by source file (from Source: line). Returns dict source_key -> [reports]."""
+    groups: Dict[str, List[_ParsedGcov]] = {}
+    for report in reports:
+        key = _source_key(report.source)
+        if key not in groups:
+            groups[key] = []
+        groups[key].append(report)
     return groups
 
 
@@ -502,7 +904,16 @@ def main() -> None:
         action="store_true",
         help="Skip gcovr merge/summary (only use lcov)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker processes for parsing .gcov.txt files (default: CPU count; 1 = no pool)",
+    )
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     workspace_root = WORKSPACE_ROOT
     result_dir = workspace_root / args.result_dir if args.result_dir else DEFAULT_RESULT_DIR
@@ -531,6 +942,7 @@ def main() -> None:
                 output_dir,
                 use_lcov=not args.no_lcov,
                 use_gcovr=not args.no_gcovr,
+                jobs=args.jobs,
             )
             if ok:
                 print(f"Tracefiles and merged output in: {output_dir}")
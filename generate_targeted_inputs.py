@@ -5,15 +5,22 @@ call LLM with prompt_target_uncovered, and output list of inputs (JSON) to stdou
 """
 
 import argparse
-import ast
+import asyncio
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from prompt import prompt_target_uncovered
 from openai_client import OpenAIClient
-from run_symbolic_executor import UTIL_TO_REPORT_NAME, get_programs_from_result_llm
+from symbolic_llm import parse_response_list
+from run_symbolic_executor import UTIL_TO_REPORT_NAME, get_programs_from_result_llm, resolve_program_path
 
 
 WORKSPACE_ROOT = Path(__file__).parent.resolve()
@@ -23,24 +30,15 @@ DEFAULT_MERGED_COVERAGE = WORKSPACE_ROOT / "result" / "llm" / "merged-coverage"
 # Map source file stem to executable name (for special cases like lbracket.c -> "[")
 REPORT_NAME_TO_UTIL = {v: k for k, v in UTIL_TO_REPORT_NAME.items()}
 
+# Instruction suffix appended to every targeted prompt (built once).
+PROMPT_TARGET_UNCOVERED_WITH_SEP = "\n\n" + prompt_target_uncovered
+
 
-def resolve_program_path(program: str, workspace_root: Path) -> Path:
-    """Resolve program to an absolute path. Tries coreutils src, then coreutils-6.11."""
-    p = Path(program)
-    if p.is_absolute() and p.exists():
-        return p
-    if p.exists():
-        return p.resolve()
-    for base in ("coreutils/coreutils-8.32/src", "coreutils/coreutils-6.11/src"):
-        candidate = workspace_root / base / program
-        if candidate.exists():
-            return candidate
-    # Allow program as bare name e.g. md5sum.c
-    for base in ("coreutils/coreutils-8.32/src", "coreutils/coreutils-6.11/src"):
-        candidate = workspace_root / base / p.name
-        if candidate.exists():
-            return candidate
-    return (workspace_root / program).resolve()
+def dumps_inputs(inputs_list: list) -> bytes:
+    """Serialize the inputs list as indented JSON bytes (orjson when installed, else stdlib json)."""
+    if orjson is not None:
+        return orjson.dumps(inputs_list, option=orjson.OPT_INDENT_2)
+    return json.dumps(inputs_list, indent=2).encode("utf-8")
 
 
 def source_stem_to_util(stem: str) -> str:
@@ -49,35 +47,28 @@ def source_stem_to_util(stem: str) -> str:
 
 
 def read_program(program_path: Path) -> str:
-    """Read program source."""
-    return program_path.read_text(encoding="utf-8", errors="replace")
-
-
-def parse_response_list(response: str) -> list:
-    """Parse LLM response into a list of inputs (strings for utility arguments)."""
-    s = (response or "").strip()
-    if s.startswith("```"):
-        lines = s.split("\n")
-        lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        s = "\n".join(lines)
-    s = s.strip()
-    try:
-        out = json.loads(s)
-        if isinstance(out, list):
-            return [str(x) for x in out]
-    except json.JSONDecodeError:
-        pass
-    try:
-        out = ast.literal_eval(s)
-        if isinstance(out, list):
-            return [str(x) for x in out]
-    except (ValueError, SyntaxError):
-        pass
-    if s:
-        return [s]
-    return []
+    """Read program source (cached per path for the lifetime of the process)."""
+    return _read_program_cached(str(program_path))
+
+
+@lru_cache(maxsize=None)
+def _read_program_cached(program_path: str) -> str:
+    return Path(program_path).read_text(encoding="utf-8", errors="replace")
+
+
+def build_target_prompt(program_content: str, cumulative_content: str) -> str:
+    """Build the full prompt: program source, cumulative coverage report, then the instruction."""
+    return "".join([program_content, "\n\n", cumulative_content, PROMPT_TARGET_UNCOVERED_WITH_SEP])
+
+
+def fit_cumulative(client: OpenAIClient, cumulative_content: str, max_report_tokens: int) -> str:
+    """
+    Trim covered lines from the cumulative report until it fits max_report_tokens (0 = no limit).
+    Only the report counts against the budget: the program source is sent in full either way.
+    """
+    if max_report_tokens <= 0:
+        return cumulative_content
+    return client.fit_prompt(cumulative_content, "", max_report_tokens)
 
 
 def main() -> None:
@@ -101,6 +92,13 @@ def main() -> None:
         default=0,
         help="When using --all, max number of programs to process (default: 0 = all).",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=8,
+        help="When using --all, number of concurrent LLM requests (default: 8).",
+    )
     parser.add_argument(
         "--function-name",
         type=str,
@@ -130,6 +128,28 @@ def main() -> None:
         default=4096,
         help="Max completion tokens (default: 4096)",
     )
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=0.3,
+        help="Sampling temperature (default: 0.3; use 0 for deterministic, cached answers)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the LLM response cache (~/.cache/klee-llm)",
+    )
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Also reuse answers to near-identical earlier prompts (embedding similarity; temperature 0 only)",
+    )
+    parser.add_argument(
+        "--max-report-tokens",
+        type=int,
+        default=8000,
+        help="Drop covered lines from the coverage report until it fits in this many tokens (default: 8000; 0 = no limit)",
+    )
     parser.add_argument(
         "--output",
         "-o",
@@ -159,11 +179,17 @@ def main() -> None:
         if args.limit and args.limit > 0:
             programs = programs[: args.limit]
         try:
-            client = OpenAIClient(api_key=args.api_key, model=args.model)
+            client = OpenAIClient(
+                api_key=args.api_key,
+                model=args.model,
+                use_cache=not args.no_cache,
+                enable_semantic_cache=args.semantic_cache,
+            )
         except Exception as e:
             print(f"OpenAI client error: {e}", file=sys.stderr)
             sys.exit(1)
         results_dir.mkdir(parents=True, exist_ok=True)
+        prompts = []
         for report_name, util_name in programs:
             cumulative_path = DEFAULT_MERGED_COVERAGE / f"src_{report_name}.c" / "cumulative.gcov.txt"
             if not cumulative_path.exists():
@@ -173,19 +199,25 @@ def main() -> None:
             if not program_path.exists():
                 print(f"Skipping {report_name} (program not found: {program_path})", file=sys.stderr)
                 continue
-            print(f"=== {report_name} ===", file=sys.stderr)
             cumulative_content = cumulative_path.read_text(encoding="utf-8", errors="replace")
             program_content = read_program(program_path)
-            full_prompt = program_content + "\n\n" + cumulative_content + "\n\n" + prompt_target_uncovered
-            try:
-                response = client.chat(
-                    full_prompt,
-                    max_tokens=args.max_tokens,
-                    temperature=0.3,
-                    timeout=300.0,
-                )
-            except Exception as e:
-                print(f"  OpenAI error: {e}", file=sys.stderr)
+            cumulative_content = fit_cumulative(client, cumulative_content, args.max_report_tokens)
+            prompts.append((report_name, build_target_prompt(program_content, cumulative_content)))
+
+        # LLM calls are network-bound: send them concurrently (async client), up to --jobs in flight.
+        responses = asyncio.run(
+            client.chat_many(
+                [full_prompt for _, full_prompt in prompts],
+                concurrency=max(1, args.jobs),
+                max_tokens=args.max_tokens,
+                temperature=args.temperature,
+                timeout=300.0,
+            )
+        )
+        for (report_name, _), response in zip(prompts, responses):
+            print(f"=== {report_name} ===", file=sys.stderr)
+            if isinstance(response, Exception):
+                print(f"  OpenAI error: {response}", file=sys.stderr)
                 continue
             response = (response or "").strip()
             inputs_list = parse_response_list(response)
@@ -193,7 +225,7 @@ def main() -> None:
                 print(f"  No parseable inputs.", file=sys.stderr)
                 continue
             out_path = results_dir / f"{report_name}_targeted_inputs.json"
-            out_path.write_text(json.dumps(inputs_list, indent=2), encoding="utf-8")
+            out_path.write_bytes(dumps_inputs(inputs_list))
             print(f"  Saved {len(inputs_list)} inputs -> {out_path.name}", file=sys.stderr)
         print("Done.", file=sys.stderr)
         return
@@ -239,17 +271,23 @@ def main() -> None:
 
     util_name = source_stem_to_util(program_path.stem)
     program_content = read_program(program_path)
-    full_prompt = program_content + "\n\n" + cumulative_content + "\n\n" + prompt_target_uncovered
 
     print(f"Program: {program_path} (util: {util_name})", file=sys.stderr)
     print(f"Cumulative report: {cumulative_path}", file=sys.stderr)
     print("Calling OpenAI...", file=sys.stderr)
     try:
-        client = OpenAIClient(api_key=args.api_key, model=args.model)
+        client = OpenAIClient(
+            api_key=args.api_key,
+            model=args.model,
+            use_cache=not args.no_cache,
+            enable_semantic_cache=args.semantic_cache,
+        )
+        cumulative_content = fit_cumulative(client, cumulative_content, args.max_report_tokens)
+        full_prompt = build_target_prompt(program_content, cumulative_content)
         response = client.chat(
             full_prompt,
             max_tokens=args.max_tokens,
-            temperature=0.3,
+            temperature=args.temperature,
             timeout=300.0,
         )
     except Exception as e:
@@ -269,10 +307,10 @@ def main() -> None:
     print(f"Generated {len(inputs_list)} inputs.", file=sys.stderr)
     
     # Output
-    output_str = json.dumps(inputs_list, indent=2)
+    output_bytes = dumps_inputs(inputs_list)
     
     if args.stdout:
-        print(output_str)
+        print(output_bytes.decode("utf-8"))
         return
 
     if args.output:
@@ -282,8 +320,7 @@ def main() -> None:
         out_path = DEFAULT_RESULT_DIR / f"{util_name}_targeted_inputs.json"
     
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(output_str)
+    out_path.write_bytes(output_bytes)
     print(f"Inputs saved to: {out_path}", file=sys.stderr)
 
 
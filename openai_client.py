@@ -1,6 +1,216 @@
+import asyncio
+import hashlib
+import httpx
+import json
+import math
 import openai
+import operator
 import os
-from typing import Optional
+import sqlite3
+import ssl
+import sys
+import threading
+import time
+from array import array
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    from openai import DefaultAioHttpClient
+except ImportError:  # older openai SDK without the aiohttp transport
+    DefaultAioHttpClient = None
+
+try:
+    import certifi
+except ImportError:
+    certifi = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+# One SSL context and one httpx.Client per pool configuration for all OpenAIClient instances in
+# this process: building the context reads the CA trust store from disk, which dominates client
+# construction, and a shared pool keeps TLS connections alive across calls and instances.
+_shared_ssl_context: Optional[ssl.SSLContext] = None
+_shared_http_clients: Dict[Tuple[int, int], httpx.Client] = {}
+_shared_http_lock = threading.Lock()
+# The httpx fallback of the async clients is reported once per process.
+_warned_aiohttp_fallback = False
+
+
+def _get_ssl_context() -> ssl.SSLContext:
+    """Return the process-wide SSL context (created on first call)."""
+    global _shared_ssl_context
+    with _shared_http_lock:
+        if _shared_ssl_context is None:
+            if certifi is not None:
+                _shared_ssl_context = ssl.create_default_context(cafile=certifi.where())
+            else:
+                _shared_ssl_context = ssl.create_default_context()
+        return _shared_ssl_context
+
+
+def _new_http_client(max_connections: int, max_keepalive_connections: int) -> httpx.Client:
+    """httpx.Client with keep-alive pooling sized for concurrent chat calls."""
+    return httpx.Client(
+        verify=_get_ssl_context(),
+        limits=httpx.Limits(
+            max_keepalive_connections=max_keepalive_connections,
+            max_connections=max_connections,
+            keepalive_expiry=30.0,
+        ),
+        # The SDK takes its default request timeout from a custom http_client; keep the SDK's own
+        # (10 minutes) so calls without an explicit timeout are not cut short.
+        timeout=openai.DEFAULT_TIMEOUT,
+        follow_redirects=True,
+    )
+
+
+def _get_shared_http_client(max_connections: int, max_keepalive_connections: int) -> httpx.Client:
+    """Return the process-wide httpx.Client for this pool size (created on first call)."""
+    key = (max_connections, max_keepalive_connections)
+    client = _shared_http_clients.get(key)
+    if client is None:
+        client = _new_http_client(max_connections, max_keepalive_connections)
+        with _shared_http_lock:
+            client = _shared_http_clients.setdefault(key, client)
+    return client
+
+
+DEFAULT_CACHE_DIR = os.path.join("~", ".cache", "klee-llm")
+
+
+class LLMCache:
+    """
+    On-disk cache of chat responses: one small JSON file per request, named by the sha256 of the
+    request payload. Only deterministic (temperature == 0) requests are cached by OpenAIClient.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: Optional[float] = None):
+        """
+        Args:
+            cache_dir: Directory for cache files (default: ~/.cache/klee-llm)
+            ttl: Seconds an entry stays valid (default: None = never expires)
+        """
+        self.cache_dir = os.path.expanduser(cache_dir or DEFAULT_CACHE_DIR)
+        self.ttl = ttl
+
+    @staticmethod
+    def key(payload: dict) -> str:
+        """Stable key for a request payload (model, messages, temperature, ...)."""
+        data = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached content for key, or None if missing or expired."""
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if self.ttl is not None and time.time() - entry.get("created", 0) > self.ttl:
+            return None
+        return entry.get("content")
+
+    def set(self, key: str, content: str) -> None:
+        """Store content under key (atomically; errors are ignored, the cache is best-effort)."""
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"created": time.time(), "content": content}, f, ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache: returns the stored response of the most similar earlier prompt
+    (cosine similarity >= threshold) for the same model. Vectors and responses are kept in a
+    SQLite file and loaded into memory on first use.
+    """
+
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    # Keep embedding requests under the embedding model's input limit.
+    MAX_EMBED_CHARS = 20000
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        threshold: float = 0.92,
+        embedding_model: str = EMBEDDING_MODEL,
+    ):
+        """
+        Args:
+            path: SQLite file (default: ~/.cache/klee-llm/semantic.sqlite3)
+            threshold: Minimum cosine similarity for a hit
+            embedding_model: OpenAI embedding model used for prompts
+        """
+        self.path = os.path.expanduser(path or os.path.join(DEFAULT_CACHE_DIR, "semantic.sqlite3"))
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._entries: Dict[str, List[Tuple[array, str]]] = {}  # model -> [(unit vector, content)]
+
+    @classmethod
+    def embedding_input(cls, messages: list) -> str:
+        """Text embedded for a request: its message contents, truncated."""
+        return "\n\n".join(str(m.get("content") or "") for m in messages)[: cls.MAX_EMBED_CHARS]
+
+    @staticmethod
+    def normalize(vector) -> array:
+        """float32 copy of vector scaled to unit length (so dot product == cosine similarity)."""
+        vec = array("f", vector)
+        norm = math.sqrt(sum(x * x for x in vec))
+        if norm:
+            vec = array("f", (x / norm for x in vec))
+        return vec
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries (model TEXT NOT NULL, vector BLOB NOT NULL, content TEXT NOT NULL)"
+            )
+            for model, blob, content in conn.execute("SELECT model, vector, content FROM entries"):
+                vec = array("f")
+                vec.frombytes(blob)
+                self._entries.setdefault(model, []).append((vec, content))
+            self._conn = conn
+        return self._conn
+
+    def lookup(self, model: str, vec: array) -> Optional[str]:
+        """Content of the most similar cached prompt for model, or None below the threshold."""
+        with self._lock:
+            self._connect()
+            best, best_score = None, self.threshold
+            for other, content in self._entries.get(model, ()):
+                if len(other) != len(vec):
+                    continue
+                score = sum(map(operator.mul, vec, other))
+                if score >= best_score:
+                    best, best_score = content, score
+            return best
+
+    def add(self, model: str, vec: array, content: str) -> None:
+        """Store a prompt embedding and its response."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("INSERT INTO entries VALUES (?, ?, ?)", (model, vec.tobytes(), content))
+            conn.commit()
+            self._entries.setdefault(model, []).append((vec, content))
 
 
 class OpenAIClient:
@@ -8,7 +218,15 @@ class OpenAIClient:
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
-        model: str = "gpt-5.2-2025-12-11"
+        model: str = "gpt-5.2-2025-12-11",
+        share_http_client: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        cache: Optional[LLMCache] = None,
+        use_cache: bool = True,
+        enable_semantic_cache: bool = False,
+        semantic_cache: Optional[SemanticCache] = None,
+        max_retries: int = 6,
     ):
         """
         Initialize OpenAI client.
@@ -17,6 +235,17 @@ class OpenAIClient:
             api_key: OpenAI API key. If not provided, will try OPENAI_API_KEY env var.
             base_url: Base URL for API (default: OpenAI official; set for Azure/custom endpoints).
             model: Model to use (default: gpt-5.2-2025-12-11)
+            share_http_client: Reuse the process-wide httpx.Client (connection pool and SSL context).
+                Set False to give this instance its own, e.g. when serving unrelated users/keys.
+            max_connections: Maximum concurrent connections in the HTTP pool.
+            max_keepalive_connections: Idle connections kept open (30s) for reuse between calls.
+            cache: Response cache for temperature=0 calls (default: LLMCache() in ~/.cache/klee-llm)
+            use_cache: Set False to disable the response cache entirely.
+            enable_semantic_cache: Also reuse responses of near-duplicate prompts (embedding
+                similarity, see SemanticCache) for temperature=0 calls. Off by default.
+            semantic_cache: SemanticCache to use (implies enable_semantic_cache).
+            max_retries: Retries for rate limits (429), timeouts, connection and 5xx errors, with
+                exponential backoff and jitter (done by the SDK); 400-class errors fail at once.
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
@@ -27,11 +256,204 @@ class OpenAIClient:
         self.base_url = base_url  # None uses OpenAI default
         self.model = model
 
-        client_kwargs = {"api_key": self.api_key}
+        client_kwargs = {"api_key": self.api_key, "max_retries": max_retries}
         if self.base_url is not None:
             client_kwargs["base_url"] = self.base_url
 
-        self.client = openai.Client(**client_kwargs)
+        self._client_kwargs = client_kwargs
+        if share_http_client:
+            http_client = _get_shared_http_client(max_connections, max_keepalive_connections)
+        else:
+            http_client = _new_http_client(max_connections, max_keepalive_connections)
+        self.client = openai.Client(**client_kwargs, http_client=http_client)
+        self._aclients: Dict[asyncio.AbstractEventLoop, "openai.AsyncOpenAI"] = {}
+        self.cache = (cache or LLMCache()) if use_cache else None
+        self.semantic_cache = semantic_cache or (SemanticCache() if enable_semantic_cache else None)
+        self._encoding = None
+
+    @property
+    def aclient(self) -> "openai.AsyncOpenAI":
+        """
+        Async client for the running event loop, created on first use in that loop (its
+        connections belong to the loop, so each asyncio.run() gets its own).
+        """
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+        if client is None:
+            # Clients of loops that have since closed cannot be used (or closed) any more.
+            self._aclients = {l: c for l, c in self._aclients.items() if not l.is_closed()}
+            client = self._aclients[loop] = self._new_aclient()
+        return client
+
+    def _new_aclient(self) -> "openai.AsyncOpenAI":
+        """
+        New async client. Uses the aiohttp transport when the SDK and aiohttp support it
+        (pip install "openai[aiohttp]"), else the default httpx one.
+        """
+        global _warned_aiohttp_fallback
+        kwargs = dict(self._client_kwargs)
+        fallback = None
+        if DefaultAioHttpClient is None:
+            fallback = "openai SDK has no aiohttp transport; async calls use httpx (upgrade openai)"
+        else:
+            try:
+                kwargs["http_client"] = DefaultAioHttpClient()
+            except RuntimeError as e:
+                fallback = f'aiohttp transport unavailable ({e}); async calls use httpx (pip install "openai[aiohttp]")'
+        if fallback is not None and not _warned_aiohttp_fallback:
+            _warned_aiohttp_fallback = True
+            sys.stderr.write(fallback + "\n")
+        return openai.AsyncOpenAI(**kwargs)
+
+    def count_tokens(self, text: str) -> int:
+        """
+        Number of tokens text takes for this client's model (tiktoken), or an estimate of
+        4 characters per token when tiktoken is not installed.
+        """
+        if tiktoken is None:
+            return (len(text) + 3) // 4
+        if self._encoding is None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(self.model)
+            except KeyError:  # model newer than this tiktoken
+                self._encoding = tiktoken.get_encoding("o200k_base")
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    def fit_prompt(self, prefix: str, instruction: str, budget: int = 8000) -> str:
+        """
+        Trim a gcov coverage report so that prefix + instruction fit in budget tokens.
+
+        Covered lines (a numeric hit count, or "+" as in cumulative.gcov.txt) are dropped, from the
+        top, until the total fits; "#####" (uncovered) and "-" (non-executable) lines are always kept
+        since they are what the instruction asks about. Returns prefix unchanged if it already fits.
+        """
+        total = self.count_tokens(prefix) + self.count_tokens(instruction)
+        if total <= budget:
+            return prefix
+        lines = prefix.split("\n")
+        keep = [True] * len(lines)
+        for i, line in enumerate(lines):
+            count, sep, _ = line.partition(":")
+            count = count.strip()
+            if not sep or not (count == "+" or count.rstrip("*").isdigit()):
+                continue
+            keep[i] = False
+            total -= self.count_tokens(line + "\n")
+            if total <= budget:
+                break
+        return "\n".join(line for line, k in zip(lines, keep) if k)
+
+    def _create_kwargs(
+        self,
+        messages: list,
+        model: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> dict:
+        """Build chat.completions.create() arguments shared by the sync and async calls."""
+        create_kwargs = dict(
+            model=model or self.model,
+            messages=messages,
+            temperature=temperature,
+            **kwargs
+        )
+        # GPT-5.2+ require max_completion_tokens; send via extra_body (SDK doesn't accept it as direct arg)
+        create_kwargs["extra_body"] = {**(create_kwargs.get("extra_body") or {}), "max_completion_tokens": max_tokens}
+        return create_kwargs
+
+    def _cache_key(self, create_kwargs: dict, no_cache: bool) -> Optional[str]:
+        """Cache key for a deterministic (temperature == 0) request, else None."""
+        if no_cache or self.cache is None or create_kwargs.get("temperature") != 0:
+            return None
+        return LLMCache.key({k: v for k, v in create_kwargs.items() if k != "timeout"})
+
+    def _use_semantic_cache(self, create_kwargs: dict, no_cache: bool) -> bool:
+        """The semantic cache follows the same rules as the exact cache (deterministic calls only)."""
+        return not no_cache and self.semantic_cache is not None and create_kwargs.get("temperature") == 0
+
+    def _embed(self, create_kwargs: dict) -> Optional[array]:
+        """Unit embedding of the request's messages, or None if the embedding call fails."""
+        try:
+            result = self.client.embeddings.create(
+                model=self.semantic_cache.embedding_model,
+                input=SemanticCache.embedding_input(create_kwargs["messages"]),
+            )
+        except Exception:
+            return None
+        return SemanticCache.normalize(result.data[0].embedding)
+
+    async def _aembed(self, aclient: "openai.AsyncOpenAI", create_kwargs: dict) -> Optional[array]:
+        """Async counterpart of _embed(), through aclient."""
+        try:
+            result = await aclient.embeddings.create(
+                model=self.semantic_cache.embedding_model,
+                input=SemanticCache.embedding_input(create_kwargs["messages"]),
+            )
+        except Exception:
+            return None
+        return SemanticCache.normalize(result.data[0].embedding)
+
+    def _cached(self, key: Optional[str], model: str, vec: Optional[array]) -> Optional[str]:
+        """Response from the exact cache (key) or, given the prompt embedding, the semantic cache."""
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        if vec is not None:
+            return self.semantic_cache.lookup(model, vec)
+        return None
+
+    def _store(self, key: Optional[str], model: str, vec: Optional[array], content: Optional[str]) -> None:
+        """Record a fresh response in the caches it was looked up in."""
+        if content is None:
+            return
+        if key is not None:
+            self.cache.set(key, content)
+        if vec is not None:
+            self.semantic_cache.add(model, vec, content)
+
+    @staticmethod
+    def _api_error(e: Exception) -> Exception:
+        return Exception(f"Error making OpenAI API call: {str(e)}")
+
+    def _complete(self, create_kwargs: dict, no_cache: bool = False):
+        """Run a chat completion through the sync client, consulting the response caches."""
+        model = create_kwargs["model"]
+        key = self._cache_key(create_kwargs, no_cache)
+        cached = self._cached(key, model, None)
+        if cached is not None:
+            return cached
+        vec = self._embed(create_kwargs) if self._use_semantic_cache(create_kwargs, no_cache) else None
+        cached = self._cached(None, model, vec)
+        if cached is not None:
+            return cached
+        try:
+            result = self.client.chat.completions.create(**create_kwargs)
+            content = result.choices[0].message.content
+        except Exception as e:
+            raise self._api_error(e)
+        self._store(key, model, vec, content)
+        return content
+
+    async def _acomplete(self, aclient: "openai.AsyncOpenAI", create_kwargs: dict, no_cache: bool = False):
+        """Async counterpart of _complete(), through the given async client."""
+        model = create_kwargs["model"]
+        key = self._cache_key(create_kwargs, no_cache)
+        cached = self._cached(key, model, None)
+        if cached is not None:
+            return cached
+        vec = await self._aembed(aclient, create_kwargs) if self._use_semantic_cache(create_kwargs, no_cache) else None
+        cached = self._cached(None, model, vec)
+        if cached is not None:
+            return cached
+        try:
+            result = await aclient.chat.completions.create(**create_kwargs)
+            content = result.choices[0].message.content
+        except Exception as e:
+            raise self._api_error(e)
+        self._store(key, model, vec, content)
+        return content
 
     def chat(
         self,
@@ -40,6 +462,7 @@ class OpenAIClient:
         max_tokens: int = 512,
         temperature: float = 0.7,
         timeout: float = 120.0,
+        no_cache: bool = False,
         **kwargs
     ):
         """
@@ -51,28 +474,127 @@ class OpenAIClient:
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature
             timeout: Request timeout in seconds (default: 120)
+            no_cache: Bypass the response cache (only used when temperature == 0)
             **kwargs: Additional parameters to pass to the API
 
         Returns:
             The response content from the model
         """
-        model = model or self.model
         messages = [{"content": prompt, "role": "user"}]
-        create_kwargs = dict(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            timeout=timeout,
-            **kwargs
-        )
-        # GPT-5.2+ require max_completion_tokens; send via extra_body (SDK doesn't accept it as direct arg)
-        create_kwargs["extra_body"] = {**(create_kwargs.get("extra_body") or {}), "max_completion_tokens": max_tokens}
+        create_kwargs = self._create_kwargs(messages, model, max_tokens, temperature, timeout=timeout, **kwargs)
+        return self._complete(create_kwargs, no_cache)
+
+    def chat_stream(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        no_cache: bool = False,
+        stop: Optional[Callable[[str, str], bool]] = None,
+        **kwargs
+    ) -> Iterator[str]:
+        """
+        Streaming version of chat(): yields the response text piece by piece as it is generated.
+        "".join(chat_stream(...)) equals chat(...). The caller may stop iterating early; the HTTP
+        stream is then closed and nothing is cached.
+        A cached response (temperature == 0) is yielded as a single piece.
 
+        stop, if given, is called as stop(text so far, newest piece) after each piece, so it can skip
+        pieces that cannot end the answer without rescanning the text; once it returns True the
+        stream is closed and that text is the whole response, cached like a complete one.
+        Such responses are cached apart from full ones (chat() never returns a cut-short answer).
+        The semantic cache, when enabled, is consulted and filled the same way as in chat().
+        timeout defaults to the SDK's request timeout, since a stream stays open for the whole answer.
+        """
+        messages = [{"content": prompt, "role": "user"}]
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        create_kwargs = self._create_kwargs(messages, model, max_tokens, temperature, **kwargs)
+        key = self._cache_key(create_kwargs if stop is None else {**create_kwargs, "stream_stop": True}, no_cache)
+        semantic_model = create_kwargs["model"] if stop is None else f"{create_kwargs['model']}|stream_stop"
+        cached = self._cached(key, semantic_model, None)
+        if cached is not None:
+            yield cached
+            return
+        vec = self._embed(create_kwargs) if self._use_semantic_cache(create_kwargs, no_cache) else None
+        cached = self._cached(None, semantic_model, vec)
+        if cached is not None:
+            yield cached
+            return
         try:
-            result = self.client.chat.completions.create(**create_kwargs)
-            return result.choices[0].message.content
+            stream = self.client.chat.completions.create(stream=True, **create_kwargs)
         except Exception as e:
-            raise Exception(f"Error making OpenAI API call: {str(e)}")
+            raise self._api_error(e)
+        content = ""
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                piece = chunk.choices[0].delta.content
+                if piece:
+                    content += piece
+                    yield piece
+                    if stop is not None and stop(content, piece):
+                        break
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+        if content:
+            self._store(key, semantic_model, vec, content)
+
+    async def achat(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        timeout: float = 120.0,
+        no_cache: bool = False,
+        **kwargs
+    ):
+        """
+        Async version of chat(), sent through aclient. Same arguments and return value.
+        """
+        messages = [{"content": prompt, "role": "user"}]
+        create_kwargs = self._create_kwargs(messages, model, max_tokens, temperature, timeout=timeout, **kwargs)
+        return await self._acomplete(self.aclient, create_kwargs, no_cache)
+
+    async def chat_many(
+        self,
+        prompts: List[str],
+        concurrency: int = 32,
+        model: Optional[str] = None,
+        max_tokens: int = 512,
+        temperature: float = 0.7,
+        timeout: float = 120.0,
+        no_cache: bool = False,
+        **kwargs
+    ) -> List[Union[str, Exception]]:
+        """
+        Send many prompts concurrently, at most `concurrency` requests in flight, through an
+        async client opened for this call and closed when it returns.
+
+        Args:
+            prompts: Prompts to send (one chat completion each)
+            concurrency: Maximum number of simultaneous requests
+            model, max_tokens, temperature, timeout, no_cache, **kwargs: As for chat(), for every prompt
+
+        Returns:
+            One entry per prompt, in order: the response content, or the exception it raised
+        """
+        sem = asyncio.Semaphore(max(1, concurrency))
+        async with self._new_aclient() as aclient:
+
+            async def one(prompt: str):
+                messages = [{"content": prompt, "role": "user"}]
+                create_kwargs = self._create_kwargs(messages, model, max_tokens, temperature, timeout=timeout, **kwargs)
+                async with sem:
+                    return await self._acomplete(aclient, create_kwargs, no_cache)
+
+            return await asyncio.gather(*(one(p) for p in prompts), return_exceptions=True)
 
     def chat_with_system(
         self,
@@ -81,6 +603,7 @@ class OpenAIClient:
         model: Optional[str] = None,
         max_tokens: int = 512,
         temperature: float = 0.7,
+        no_cache: bool = False,
         **kwargs
     ):
         """
@@ -92,35 +615,22 @@ class OpenAIClient:
             model: Model to use (overrides default if provided)
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature
+            no_cache: Bypass the response cache (only used when temperature == 0)
             **kwargs: Additional parameters to pass to the API
 
         Returns:
             The response content from the model
         """
-        model = model or self.model
         messages = [
             {"content": system_prompt, "role": "system"},
             {"content": user_prompt, "role": "user"},
         ]
-        create_kwargs = dict(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            **kwargs
-        )
-        create_kwargs["extra_body"] = {**(create_kwargs.get("extra_body") or {}), "max_completion_tokens": max_tokens}
-
-        try:
-            result = self.client.chat.completions.create(**create_kwargs)
-            return result.choices[0].message.content
-        except Exception as e:
-            raise Exception(f"Error making OpenAI API call: {str(e)}")
+        create_kwargs = self._create_kwargs(messages, model, max_tokens, temperature, **kwargs)
+        return self._complete(create_kwargs, no_cache)
 
 
 def main():
     """Example usage"""
-    import sys
-
     # You can set the API key as an environment variable or pass it directly
     # export OPENAI_API_KEY="your-api-key-here"
 
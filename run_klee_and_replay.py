@@ -4,7 +4,7 @@ Run KLEE on all .bc files, save klee-stats to result/klee/<util>.txt,
 then replay each .ktest with the gcov binary and merge line coverage into result/klee/merged-coverage.
 
 Steps:
-  1. For each .bc: run KLEE in docker (writes to cwd/klee-last), copy klee-last to result/klee/<util>/, klee-stats -> result/klee/<util>.txt
+  1. For each .bc: run KLEE in docker with --output-dir=result/klee/<util>/, klee-stats -> result/klee/<util>.txt
   2. For each util with .ktest files: run ktest-tool to get args, run obj-gcov/src/<util> with those args, run gcov, save .gcov.txt to result/klee/<util>_klee_coverage/
   3. Run coverage_aggregate on all *_klee_coverage dirs -> result/klee/merged-coverage and result/klee/merged_summary.txt
 
@@ -20,13 +20,17 @@ When using docker from the host, set WORKSPACE_HOST to the host path mounted as
 import argparse
 import ast
 import os
+import platform
 import re
 import shutil
 import subprocess
 import sys
-import time
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 WORKSPACE_ROOT = Path(__file__).parent.resolve()
 # When script runs inside Docker, inner "docker run -v" is resolved on the host. Use WORKSPACE_HOST
@@ -45,11 +49,14 @@ STEP1_BUILD_GCOV = WORKSPACE_ROOT / "step1-build-gcov.sh"
 KLEE_OUTPUT_DIR = KLEE_RESULT_DIR  # KLEE --output-dir (per-util subdirs)
 DOCKER_IMAGE = "klee-coreutils"
 
-# Same as run_symbolic_executor: [ -> lbracket for dirs and gcov base
+# Same as run_symbolic_executor: [ -> lbracket for dirs
 UTIL_TO_REPORT_NAME: dict[str, str] = {"[": "lbracket"}
-UTIL_TO_GCOV_BASE: dict[str, str] = {"[": "lbracket"}
+UTIL_FROM_REPORT_NAME: dict[str, str] = {v: k for k, v in UTIL_TO_REPORT_NAME.items()}
 
 KLEE_SYM_ARGS = "--sym-args 0 2 4"
+# gcov stdout line naming each report it writes, e.g. "Creating 'cat.c.gcov'"
+GCOV_CREATING_RE = re.compile(r"[Cc]reating '([^']+\.gcov)'")
+KTEST_ARGS_RE = re.compile(r"^args\s*:\s*(\[.*\])")
 KLEE_MAX_TIME = 300
 
 
@@ -74,20 +81,24 @@ def report_name(util: str) -> str:
 
 
 def run_klee(util_name: str, output_subdir: Path, timeout: int = KLEE_MAX_TIME) -> bool:
-    """Run KLEE (writes to cwd/klee-last); copy klee-last to output_subdir; klee-stats -> result/klee/<util>.txt."""
-    output_subdir.mkdir(parents=True, exist_ok=True)
+    """Run KLEE with --output-dir=output_subdir (replacing any previous run); klee-stats -> result/klee/<util>.txt."""
+    output_subdir.parent.mkdir(parents=True, exist_ok=True)
     stats_file = KLEE_RESULT_DIR / f"{report_name(util_name)}.txt"
-    # Pass .bc path via env so shell does not expand special chars (e.g. [ in "[.bc")
+    # Pass .bc path and output dir via env so shell does not expand special chars (e.g. [ in "[.bc").
+    # KLEE refuses an existing --output-dir, so the previous run's output is removed first (inside
+    # the same shell, so files created by root in the container can be removed too).
     bc_path = f"./{util_name}.bc"
     shell_cmd = (
-        f"klee --libc=uclibc --posix-runtime --max-time={timeout} "
-        f"\"$KLEE_BC\" {KLEE_SYM_ARGS} 2>/dev/null; klee-stats klee-last"
+        f"rm -rf \"$KLEE_OUT\"; "
+        f"klee --libc=uclibc --posix-runtime --max-time={timeout} --output-dir=\"$KLEE_OUT\" "
+        f"\"$KLEE_BC\" {KLEE_SYM_ARGS} 2>/dev/null; klee-stats \"$KLEE_OUT\""
     )
     try:
         with open(stats_file, "w", encoding="utf-8") as f:
             if USE_NATIVE_KLEE:
                 env = os.environ.copy()
                 env["KLEE_BC"] = bc_path
+                env["KLEE_OUT"] = str(output_subdir)
                 r = subprocess.run(
                     ["bash", "-c", shell_cmd],
                     cwd=str(BC_DIR),
@@ -97,28 +108,24 @@ def run_klee(util_name: str, output_subdir: Path, timeout: int = KLEE_MAX_TIME)
                     env=env,
                 )
             else:
+                # KLEE writes straight into output_subdir: under the workspace mount when possible,
+                # else through an extra mount of its parent directory.
+                mounts = ["-v", f"{WORKSPACE_FOR_DOCKER_V}:/workspace"]
+                try:
+                    klee_out = "/workspace/" + output_subdir.relative_to(WORKSPACE_ROOT).as_posix()
+                except ValueError:
+                    mounts += ["-v", f"{output_subdir.parent}:/klee-output"]
+                    klee_out = f"/klee-output/{output_subdir.name}"
                 cmd = [
                     "docker", "run", "--rm",
-                    "-v", f"{WORKSPACE_FOR_DOCKER_V}:/workspace",
+                    *mounts,
                     "-w", "/workspace/coreutils/coreutils-8.32/obj-llvm/src",
                     "-e", f"KLEE_BC={bc_path}",
+                    "-e", f"KLEE_OUT={klee_out}",
                     DOCKER_IMAGE,
                     "bash", "-c", shell_cmd,
                 ]
                 r = subprocess.run(cmd, cwd=str(WORKSPACE_ROOT), stdout=f, stderr=subprocess.STDOUT, timeout=timeout + 60)
-        # Copy KLEE output from obj-llvm/src/klee-last to result/klee/<util>/ so replay finds .ktest
-        klee_last = BC_DIR / "klee-last"
-        if klee_last.exists():
-            src = klee_last.resolve() if klee_last.is_symlink() else klee_last
-            if src.is_dir():
-                for f in src.iterdir():
-                    dest = output_subdir / f.name
-                    if dest.exists():
-                        if dest.is_dir():
-                            shutil.rmtree(dest, ignore_errors=True)
-                        else:
-                            dest.unlink(missing_ok=True)
-                    shutil.copytree(f, dest, symlinks=True) if f.is_dir() else shutil.copy2(f, dest)
         return r.returncode == 0
     except (subprocess.TimeoutExpired, FileNotFoundError) as e:
         with open(stats_file, "a", encoding="utf-8") as f:
@@ -126,45 +133,123 @@ def run_klee(util_name: str, output_subdir: Path, timeout: int = KLEE_MAX_TIME)
         return False
 
 
+def _parse_ktest_args(lines) -> Optional[List[str]]:
+    """
+    Return the argv list from the first 'args : [...]' line of ktest-tool output, or None.
+    Stops reading at that line; the object dumps that follow are never looked at.
+    """
+    # e.g. "args       : ['./base64.bc', 'x', 'y']"
+    for line in lines:
+        m = KTEST_ARGS_RE.match(line)
+        if m:
+            return ast.literal_eval(m.group(1))
+    return None
+
+
 def ktest_tool_get_args(ktest_path: Path) -> Optional[List[str]]:
     """Run ktest-tool on ktest_path; parse 'args : [...]' and return list of argv strings."""
+    if USE_NATIVE_KLEE:
+        cmd = ["ktest-tool", str(ktest_path)]
+    else:
+        rel = ktest_path.relative_to(WORKSPACE_ROOT).as_posix()
+        cmd = [
+            "docker", "run", "--rm",
+            "-v", f"{WORKSPACE_FOR_DOCKER_V}:/workspace",
+            "-w", "/workspace",
+            DOCKER_IMAGE,
+            "ktest-tool", rel,
+        ]
     try:
-        if USE_NATIVE_KLEE:
-            out = subprocess.run(
-                ["ktest-tool", str(ktest_path)],
-                cwd=str(WORKSPACE_ROOT),
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-        else:
-            rel = ktest_path.relative_to(WORKSPACE_ROOT).as_posix()
-            cmd = [
-                "docker", "run", "--rm",
-                "-v", f"{WORKSPACE_FOR_DOCKER_V}:/workspace",
-                "-w", "/workspace",
-                DOCKER_IMAGE,
-                "ktest-tool", rel,
-            ]
-            out = subprocess.run(
-                cmd,
-                cwd=str(WORKSPACE_ROOT),
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-        if out.returncode != 0:
-            return None
-        # e.g. "args : ['./base64.bc', 'x', 'y']" or "args: [...]"
-        m = re.search(r"args\s*:\s*(\[[^\]]*\]|\S+)", out.stdout)
-        if not m:
-            return None
-        list_str = m.group(1).strip()
-        if list_str.startswith("["):
-            return ast.literal_eval(list_str)
+        proc = subprocess.Popen(
+            cmd,
+            cwd=str(WORKSPACE_ROOT),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except Exception:
         return None
+    timer = threading.Timer(30, proc.kill)
+    timer.start()
+    try:
+        args_list = _parse_ktest_args(proc.stdout)
+        if args_list is not None:
+            proc.kill()  # rest of the output is the object dump; not needed
+        return args_list
     except Exception:
         return None
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+        proc.wait()
+
+
+# Markers printed around each file by the batched ktest-tool loop in ktest_tool_get_args_many.
+_KTEST_BEGIN = "==KTEST-BEGIN=="
+_KTEST_STATUS = "==KTEST-STATUS=="
+
+
+def ktest_tool_get_args_many(ktest_paths: List[Path]) -> List[Optional[List[str]]]:
+    """
+    ktest_tool_get_args for many files. With docker, all files go through one container running
+    ktest-tool in a shell loop (one container start instead of one per .ktest); natively, each
+    file is a plain ktest-tool call.
+    """
+    if USE_NATIVE_KLEE or not ktest_paths:
+        return [ktest_tool_get_args(p) for p in ktest_paths]
+    try:
+        rels = [p.relative_to(WORKSPACE_ROOT).as_posix() for p in ktest_paths]
+    except ValueError:
+        return [ktest_tool_get_args(p) for p in ktest_paths]
+    script = (
+        f'for f in "$@"; do echo "{_KTEST_BEGIN}"; ktest-tool "$f"; echo "{_KTEST_STATUS} $?"; done'
+    )
+    # Named so a timed-out batch can be stopped: killing the docker client leaves the container running.
+    name = f"ktest-tool-batch-{uuid.uuid4().hex[:12]}"
+    cmd = [
+        "docker", "run", "--rm", "--init", "--name", name,
+        "-v", f"{WORKSPACE_FOR_DOCKER_V}:/workspace",
+        "-w", "/workspace",
+        DOCKER_IMAGE,
+        "bash", "-c", script, "ktest-tool-batch", *rels,
+    ]
+    try:
+        out = subprocess.run(
+            cmd,
+            cwd=str(WORKSPACE_ROOT),
+            capture_output=True,
+            text=True,
+            timeout=30 + 5 * len(rels),
+        )
+        stdout = out.stdout
+    except subprocess.TimeoutExpired as e:
+        try:
+            subprocess.run(
+                ["docker", "kill", name],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30,
+            )
+        except Exception:
+            pass
+        # Keep the files that finished before the timeout; the rest are filled with None below.
+        stdout = e.stdout or ""
+        if isinstance(stdout, bytes):
+            stdout = stdout.decode("utf-8", errors="replace")
+    except Exception:
+        return [None] * len(ktest_paths)
+    results: List[Optional[List[str]]] = []
+    for section in stdout.split(_KTEST_BEGIN + "\n")[1:]:
+        body, _, status = section.rpartition(_KTEST_STATUS)
+        if status.strip() != "0":
+            results.append(None)
+            continue
+        try:
+            results.append(_parse_ktest_args(body.splitlines()))
+        except Exception:
+            results.append(None)
+    results.extend([None] * (len(ktest_paths) - len(results)))
+    return results[: len(ktest_paths)]
 
 
 def build_obj_gcov_in_container() -> bool:
@@ -175,6 +260,8 @@ def build_obj_gcov_in_container() -> bool:
     if not STEP1_BUILD_GCOV.exists():
         sys.stderr.write("step1-build-gcov.sh not found.\n")
         return False
+    # Binaries are about to be replaced: earlier probe results no longer apply.
+    _clear_probe_caches()
     try:
         env = os.environ.copy()
         env["FORCE_UNSAFE_CONFIGURE"] = "1"  # allow configure when running as root (e.g. in Docker)
@@ -193,36 +280,80 @@ def build_obj_gcov_in_container() -> bool:
         return False
 
 
-def _find_recent_gcda_files(obj_gcov_src: Path, within_seconds: float = 2.0) -> List[Path]:
-    """Return .gcda files under obj_gcov_src modified in the last within_seconds."""
-    now = time.time()
-    out = []
-    for p in obj_gcov_src.rglob("*.gcda"):
+def _run_gcov_for_gcdas(gcda_paths: List[Path], obj_gcov_top: Path, obj_gcov_src: Path) -> List[Path]:
+    """
+    Run one gcov over all given .gcda files (bases = paths relative to obj_gcov_src without .gcda).
+    Returns the .gcov files gcov reports creating (parsed from its stdout), under obj_gcov_top.
+    """
+    bases = []
+    for gcda_path in gcda_paths:
         try:
-            if now - p.stat().st_mtime <= within_seconds:
-                out.append(p)
-        except OSError:
-            pass
-    return out
-
-
-def _run_gcov_for_gcda(gcda_path: Path, obj_gcov_top: Path, obj_gcov_src: Path) -> None:
-    """Run gcov for one .gcda (base = path relative to obj_gcov_src without .gcda)."""
+            bases.append(gcda_path.relative_to(obj_gcov_src).with_suffix("").as_posix())
+        except ValueError:
+            continue
+    if not bases:
+        return []
     try:
-        base = gcda_path.relative_to(obj_gcov_src).with_suffix("")
-        base_str = str(base).replace("\\", "/")
-        subprocess.run(
-            ["gcov", "-o", "src", base_str],
+        r = subprocess.run(
+            ["gcov", "-o", "src", *bases],
             cwd=str(obj_gcov_top),
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             timeout=60,
+            # GCOV_CREATING_RE matches gcov's untranslated "Creating '...'" lines
+            env={**os.environ, "LC_ALL": "C"},
         )
     except Exception:
-        pass
+        return []
+    return [obj_gcov_top / name for name in GCOV_CREATING_RE.findall(r.stdout or "")]
+
 
+# ELF e_machine values for the hosts we run on (platform.machine() -> e_machine).
+_ELF_MACHINES = {
+    "x86_64": 0x3E, "amd64": 0x3E,
+    "aarch64": 0xB7, "arm64": 0xB7,
+    "i386": 0x03, "i686": 0x03,
+    "armv7l": 0x28,
+}
+# (path, mtime_ns, inode) -> probe result, and (dir, ELF class, e_machine) -> (stamp of the binary
+# that was run, result of that run). Both are cleared when obj-gcov is rebuilt.
+_probe_cache: Dict[tuple, Optional[str]] = {}
+_probe_header_cache: Dict[tuple, Tuple[tuple, Optional[str]]] = {}
 
-def _probe_gcov_binary(gcov_bin: Path) -> Optional[str]:
+
+def _binary_stamp(path: Path) -> Optional[tuple]:
+    """(resolved path, mtime_ns, inode) of path, or None if it cannot be stat'ed."""
+    try:
+        resolved = path.resolve()
+        st = resolved.stat()
+    except OSError:
+        return None
+    return (str(resolved), st.st_mtime_ns, st.st_ino)
+
+
+def _clear_probe_caches() -> None:
+    """Forget all gcov binary probe results (e.g. after obj-gcov was rebuilt)."""
+    _probe_cache.clear()
+    _probe_header_cache.clear()
+
+
+def _elf_header_key(gcov_bin: Path) -> Optional[Tuple[int, int]]:
+    """
+    Return (ELF class, e_machine) of gcov_bin, or None if it is not an ELF file or could not be read.
+    """
+    try:
+        with open(gcov_bin, "rb") as f:
+            head = f.read(20)
+    except OSError:
+        return None
+    if len(head) < 20 or head[:4] != b"\x7fELF" or head[5] not in (1, 2):
+        return None
+    byteorder = "little" if head[5] == 1 else "big"
+    return head[4], int.from_bytes(head[18:20], byteorder)
+
+
+def _run_gcov_binary_version(gcov_bin: Path, env: Optional[dict] = None) -> Optional[str]:
     """Run gcov binary with --version. Return None if it runs, else an error message."""
     try:
         r = subprocess.run(
@@ -231,6 +362,7 @@ def _probe_gcov_binary(gcov_bin: Path) -> Optional[str]:
             capture_output=True,
             text=True,
             timeout=10,
+            env=env,
         )
         if r.returncode == 0:
             return None
@@ -243,6 +375,67 @@ def _probe_gcov_binary(gcov_bin: Path) -> Optional[str]:
         return str(e)
 
 
+def _probe_gcov_binary(gcov_bin: Path, env: Optional[dict] = None) -> Optional[str]:
+    """
+    Check that gcov binary can run here. Return None if it runs, else an error message.
+    The ELF header rejects binaries for another architecture without starting them. Binaries built
+    in one directory share a toolchain, so only the first one with a given header is actually run
+    (--version); the rest reuse its result while that binary is unchanged. Results are cached per
+    (path, mtime, inode).
+    """
+    try:
+        st = gcov_bin.stat()
+    except OSError as e:
+        return str(e)
+    key = (str(gcov_bin), st.st_mtime_ns, st.st_ino)
+    if key in _probe_cache:
+        return _probe_cache[key]
+    header = _elf_header_key(gcov_bin)
+    want_machine = _ELF_MACHINES.get(platform.machine().lower())
+    if header is None or want_machine is None:
+        # Not ELF (e.g. a wrapper script) or unknown host: only running it tells.
+        err = _run_gcov_binary_version(gcov_bin, env=env)
+    elif header != (2 if sys.maxsize > 2**32 else 1, want_machine):
+        err = (
+            f"ELF class {header[0]} / machine 0x{header[1]:x} does not match this host "
+            f"({platform.machine()})"
+        )
+    else:
+        header_key = (str(gcov_bin.parent), header)
+        cached = _probe_header_cache.get(header_key)
+        # Reuse the shared result only while the binary it came from is unchanged (a rebuild or a
+        # replaced binary re-probes).
+        if cached is None or _binary_stamp(Path(cached[0][0])) != cached[0]:
+            cached = (_binary_stamp(gcov_bin), _run_gcov_binary_version(gcov_bin, env=env))
+            if cached[0] is not None:
+                _probe_header_cache[header_key] = cached
+        err = cached[1]
+    _probe_cache[key] = err
+    return err
+
+
+def _gcov_prefix_env(slot: Path) -> dict:
+    """
+    Environment that makes gcov-instrumented binaries write .gcda under slot instead of obj-gcov:
+    <obj-gcov>/src/x.gcda -> <slot>/src/x.gcda. Lets concurrent replays use the same binaries.
+    """
+    env = os.environ.copy()
+    env["GCOV_PREFIX"] = str(slot)
+    env["GCOV_PREFIX_STRIP"] = str(len(OBJ_GCOV_TOP.parts) - 1)
+    return env
+
+
+def _link_gcno_for_gcda(gcda_path: Path, slot_src: Path) -> None:
+    """Symlink the .gcno matching a slot .gcda from obj-gcov/src so gcov can run inside the slot."""
+    gcno = gcda_path.with_suffix(".gcno")
+    if gcno.exists() or gcno.is_symlink():
+        return
+    try:
+        gcno.symlink_to(OBJ_GCOV_DIR / gcda_path.relative_to(slot_src).with_suffix(".gcno"))
+    except OSError:
+        pass
+
+
 def replay_ktests(
     util_name: str,
     ktest_paths: List[Path],
@@ -251,73 +444,89 @@ def replay_ktests(
 ) -> int:
     """
     Replay each .ktest with the gcov binary: ktest-tool -> args -> run binary -> gcov -> save .gcov.txt.
+    .gcda/.gcov files go to a private temporary slot (GCOV_PREFIX), so several utils can replay at once.
     Returns number of tests replayed successfully.
     """
     gcov_bin = OBJ_GCOV_DIR / util_name
     if not gcov_bin.exists() or not gcov_bin.is_file():
         return 0
-    err = _probe_gcov_binary(gcov_bin)
-    if err is not None:
-        sys.stderr.write(
-            f"  Warning: gcov binary {gcov_bin.name} did not run: {err}\n"
-            "  Replay needs binaries that run in this environment. When using Docker with a\n"
-            "  host-mounted workspace, host-built obj-gcov binaries may not run in the container.\n"
-            "  Either build obj-gcov inside the container, or run replay on the host:\n"
-            "    python3 run_klee_and_replay.py --skip-klee\n"
-        )
-        return 0
-    gcda_base = UTIL_TO_GCOV_BASE.get(util_name, util_name)
-    cwd = str(OBJ_GCOV_DIR)
-    count = 0
-    args_failures = 0
-    for i, kpath in enumerate(ktest_paths):
-        args_list = ktest_tool_get_args(kpath)
-        if not args_list:
-            args_failures += 1
-            continue
-        # Replace first arg (program) with gcov binary path
-        run_args = [str(gcov_bin)] + list(args_list[1:])
-        # Clear previous .gcda for this util so we only get this run's coverage
-        fixed_gcda = OBJ_GCOV_DIR / f"{gcda_base}.gcda"
-        if fixed_gcda.exists():
-            fixed_gcda.unlink(missing_ok=True)
-        # Also clear .gcda in subdirs (e.g. b2sum writes to blake2/*.gcda)
-        for old in OBJ_GCOV_DIR.rglob("*.gcda"):
-            try:
-                old.unlink(missing_ok=True)
-            except OSError:
-                pass
-        try:
-            subprocess.run(
-                run_args,
-                cwd=cwd,
-                capture_output=True,
-                timeout=timeout_per_run,
+    # The slot is a sibling of obj-gcov so that source paths recorded relative to obj-gcov
+    # (e.g. ../src/cat.c) still resolve when gcov runs inside it.
+    with tempfile.TemporaryDirectory(prefix=f"obj-gcov-replay-{report_name(util_name)}-", dir=OBJ_GCOV_TOP.parent) as tmp:
+        slot = Path(tmp)
+        slot_src = slot / OBJ_GCOV_DIR.relative_to(OBJ_GCOV_TOP)
+        env = _gcov_prefix_env(slot)
+        err = _probe_gcov_binary(gcov_bin, env=env)
+        if err is not None:
+            sys.stderr.write(
+                f"  Warning: gcov binary {gcov_bin.name} did not run: {err}\n"
+                "  Replay needs binaries that run in this environment. When using Docker with a\n"
+                "  host-mounted workspace, host-built obj-gcov binaries may not run in the container.\n"
+                "  Either build obj-gcov inside the container, or run replay on the host:\n"
+                "    python3 run_klee_and_replay.py --skip-klee\n"
             )
-        except (subprocess.TimeoutExpired, Exception):
-            pass
-        # Find .gcda files written by this run (recent mtime); run gcov and copy .gcov
-        recent_gcda = _find_recent_gcda_files(OBJ_GCOV_DIR, within_seconds=2.0)
-        gcov_processed = False
-        for gcda_path in recent_gcda:
-            _run_gcov_for_gcda(gcda_path, OBJ_GCOV_TOP, OBJ_GCOV_DIR)
-            gcov_processed = True
+            return 0
+        cwd = str(OBJ_GCOV_DIR)
+        count = 0
+        args_failures = 0
+        # .gcda paths this binary writes; a binary writes the same set on every normal exit, so after the
+        # first run that produced any, later runs only check these paths instead of walking the slot.
+        # Each run's .gcda are removed after gcov, so any .gcda present was written by the last run.
+        # The probe run (when not cached) already wrote that set, so the cleanup walk seeds it.
+        known_gcda: set = set()
+        for old in slot_src.rglob("*.gcda"):
+            known_gcda.add(old)
+            old.unlink(missing_ok=True)  # written by the probe
+        all_args = ktest_tool_get_args_many(ktest_paths)
+        for i, args_list in enumerate(all_args):
+            if not args_list:
+                args_failures += 1
+                continue
+            # Replace first arg (program) with gcov binary path
+            run_args = [str(gcov_bin)] + list(args_list[1:])
             try:
-                gcda_path.unlink(missing_ok=True)
-            except OSError:
+                subprocess.run(
+                    run_args,
+                    cwd=cwd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=timeout_per_run,
+                    env=env,
+                )
+            except (subprocess.TimeoutExpired, Exception):
                 pass
-        if gcov_processed:
-            for gcov_path in OBJ_GCOV_TOP.rglob("*.gcov"):
-                if not gcov_path.stem.endswith(".c"):
-                    continue
+            # Find .gcda files written by this run; run gcov and copy the .gcov it created
+            if known_gcda:
+                run_gcda = [p for p in known_gcda if p.exists()]
+            else:
+                run_gcda = list(slot_src.rglob("*.gcda"))
+                known_gcda.update(run_gcda)
+            for gcda_path in run_gcda:
+                _link_gcno_for_gcda(gcda_path, slot_src)
+            created_gcov = _run_gcov_for_gcdas(run_gcda, slot, slot_src)
+            for gcda_path in run_gcda:
                 try:
-                    rel = gcov_path.relative_to(OBJ_GCOV_TOP)
-                    dest_name = f"klee_{i+1:06d}_{rel.as_posix().replace('/', '_')}.txt"
-                    dest = coverage_dir / dest_name
-                    dest.write_text(gcov_path.read_text(encoding="utf-8", errors="replace"))
-                    count += 1
-                except Exception:
+                    gcda_path.unlink(missing_ok=True)
+                except OSError:
                     pass
+            if created_gcov:
+                for gcov_path in dict.fromkeys(created_gcov):
+                    if not gcov_path.name.endswith(".c.gcov"):
+                        continue
+                    try:
+                        rel = gcov_path.relative_to(slot)
+                        dest_name = f"klee_{i+1:06d}_{rel.as_posix().replace('/', '_')}.txt"
+                        dest = coverage_dir / dest_name
+                        # The slot copy is rewritten by the next gcov run, so move it out (same
+                        # filesystem: a rename) rather than hardlinking; copy bytes across devices.
+                        try:
+                            os.replace(gcov_path, dest)
+                        except OSError:
+                            shutil.copyfile(gcov_path, dest)
+                        count += 1
+                    except Exception:
+                        pass
     if args_failures and count == 0 and args_failures == len(ktest_paths):
         sys.stderr.write(
             f"  Warning: ktest-tool returned no args for all {len(ktest_paths)} .ktest files.\n"
@@ -369,6 +578,13 @@ def main() -> None:
         default=200,
         help="Max number of .ktest files to replay per util (default: 200); replay can be very slow otherwise",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of KLEE runs / util replays to run in parallel (default: CPU count)",
+    )
     args = parser.parse_args()
     DOCKER_IMAGE = args.docker_image
 
@@ -389,14 +605,20 @@ def main() -> None:
         if USE_NATIVE_KLEE:
             print("Using native klee/ktest-tool (running inside container).")
         print(f"Running KLEE on {len(bc_files)} .bc file(s). Output -> {results_dir}/")
-        for bc_path in bc_files:
-            util = bc_path.stem
-            rname = report_name(util)
-            out_subdir = results_dir / rname
-            print(f"  === {rname}.bc ===")
-            ok = run_klee(util, out_subdir)
-            stats_file = results_dir / f"{rname}.txt"
-            print(f"    -> {stats_file}" + ("" if ok else " (warnings/errors in output)"))
+        # Each run has its own --output-dir and stats file, so runs are independent; KLEE itself
+        # is single-threaded, so run up to --jobs of them at once.
+        with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(bc_files)))) as ex:
+            futures = {}
+            for bc_path in bc_files:
+                util = bc_path.stem
+                rname = report_name(util)
+                futures[ex.submit(run_klee, util, results_dir / rname, KLEE_MAX_TIME)] = rname
+            for fut in as_completed(futures):
+                rname = futures[fut]
+                ok = fut.result()
+                stats_file = results_dir / f"{rname}.txt"
+                print(f"  === {rname}.bc ===")
+                print(f"    -> {stats_file}" + ("" if ok else " (warnings/errors in output)"))
     else:
         print("Skipping KLEE (--skip-klee). Using existing result/klee/<util>/ .ktest files.")
 
@@ -417,8 +639,7 @@ def main() -> None:
                 ktests = list(d.rglob("*.ktest"))[:1]
                 if not ktests:
                     continue
-                rev_report = {v: k for k, v in UTIL_TO_REPORT_NAME.items()}
-                probe_util = rev_report.get(d.name, d.name)
+                probe_util = UTIL_FROM_REPORT_NAME.get(d.name, d.name)
                 break
             if probe_util and (OBJ_GCOV_DIR / probe_util).exists():
                 err = _probe_gcov_binary(OBJ_GCOV_DIR / probe_util)
@@ -434,6 +655,7 @@ def main() -> None:
         else:
             # Find all result/klee/<util>/ dirs that look like KLEE output (contain .ktest)
             replayed = 0
+            replay_jobs = []
             for d in sorted(results_dir.iterdir()):
                 if not d.is_dir():
                     continue
@@ -448,16 +670,24 @@ def main() -> None:
                     print(f"  (capping replay to first {args.max_replay} of {len(all_ktests)} .ktest for {d.name})")
                 # d.name is report name (e.g. lbracket or base64); we need bc name for gcov binary
                 # result/klee/base64 -> util base64; result/klee/lbracket -> util [
-                rev_report = {v: k for k, v in UTIL_TO_REPORT_NAME.items()}
-                util_name = rev_report.get(d.name, d.name)
+                util_name = UTIL_FROM_REPORT_NAME.get(d.name, d.name)
                 gcov_bin = OBJ_GCOV_DIR / util_name
                 if not gcov_bin.exists():
                     continue
                 coverage_dir = results_dir / f"{d.name}_klee_coverage"
                 coverage_dir.mkdir(parents=True, exist_ok=True)
-                n = replay_ktests(util_name, ktests, coverage_dir)
-                replayed += n
-                print(f"  Replayed {len(ktests)} .ktest for {d.name} -> {n} .gcov.txt in {coverage_dir.name}/")
+                replay_jobs.append((d.name, util_name, ktests, coverage_dir))
+            # Utils are independent (own binary, own coverage dir, own GCOV_PREFIX slot): replay them in parallel.
+            with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as ex:
+                futures = {
+                    ex.submit(replay_ktests, util_name, ktests, coverage_dir): (name, ktests, coverage_dir)
+                    for name, util_name, ktests, coverage_dir in replay_jobs
+                }
+                for fut in as_completed(futures):
+                    name, ktests, coverage_dir = futures[fut]
+                    n = fut.result()
+                    replayed += n
+                    print(f"  Replayed {len(ktests)} .ktest for {name} -> {n} .gcov.txt in {coverage_dir.name}/")
             if replayed:
                 print(f"  Total .gcov.txt written: {replayed}")
     else:
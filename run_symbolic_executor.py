@@ -10,18 +10,29 @@ import argparse
 import json
 import os
 import re
+import queue
 import shlex
 import subprocess
 import sys
-import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 
 WORKSPACE_ROOT = Path(__file__).parent.resolve()
 OBJ_GCOV_DIR = WORKSPACE_ROOT / "coreutils/coreutils-8.32/obj-gcov/src"
 OBJ_GCOV_TOP = WORKSPACE_ROOT / "coreutils/coreutils-8.32/obj-gcov"
 DEFAULT_RESULT_DIR = WORKSPACE_ROOT / "result" / "llm"
 
+# Source directories searched for bare program names, in priority order.
+PROGRAM_SOURCE_DIRS = ("coreutils/coreutils-8.32/src", "coreutils/coreutils-6.11/src")
+
+# Where per-worker .gcda slots are created (tmpfs); falls back to next to obj-gcov.
+_SLOT_PARENT = "/dev/shm"
+
 # Report name (from _inputs.json stem) -> binary name in obj-gcov/src (e.g. lbracket -> "[")
 REPORT_NAME_TO_UTIL: dict[str, str] = {
     "lbracket": "[",
@@ -32,71 +43,244 @@ UTIL_TO_GCOV_BASE: dict[str, str] = {
 }
 UTIL_TO_REPORT_NAME: dict[str, str] = {v: k for k, v in REPORT_NAME_TO_UTIL.items()}
 
+# Used by _arg_safe_for_filename once per input: a translate table for ASCII arguments (the usual
+# case), the regex for anything else.
+_SAFE_FILENAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-")
+_SAFE_FILENAME_TABLE = str.maketrans({chr(c): "_" for c in range(128) if chr(c) not in _SAFE_FILENAME_CHARS})
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+# Inputs without any of these split the same with str.split() as with shlex.split(): no quoting or
+# escapes, and no whitespace that str.split() knows but shlex does not (shlex: space, \t, \r, \n).
+_SHLEX_SPECIAL_CHARS = frozenset("\"'\\") | frozenset(
+    c for c in map(chr, range(0x3001)) if c.isspace() and c not in " \t\r\n"
+)
+
+# (gcov binary path, mtime_ns) -> .gcda paths, relative to obj-gcov/src, that the binary writes.
+# A binary writes the same set on every normal exit; the mtime keys out rebuilt binaries.
+# Entries are published once, as frozensets, under _KNOWN_GCDA_LOCK; workers only read them.
+_KNOWN_GCDA: Dict[Tuple[str, int], FrozenSet[str]] = {}
+_KNOWN_GCDA_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _program_index(workspace_root: str) -> Dict[str, str]:
+    """Map file name -> path for every entry in PROGRAM_SOURCE_DIRS (earlier dirs win). Built once."""
+    index: Dict[str, str] = {}
+    for base in PROGRAM_SOURCE_DIRS:
+        try:
+            with os.scandir(os.path.join(workspace_root, base)) as it:
+                for entry in it:
+                    index.setdefault(entry.name, entry.path)
+        except OSError:
+            continue
+    return index
+
+
+def resolve_program_path(program: str, workspace_root: Path) -> Path:
+    """Resolve program to an absolute path. Tries coreutils src, then coreutils-6.11."""
+    p = Path(program)
+    if p.is_absolute() and p.exists():
+        return p
+    if p.exists():
+        return p.resolve()
+    if p.name != program:
+        for base in PROGRAM_SOURCE_DIRS:
+            candidate = workspace_root / base / program
+            if candidate.exists():
+                return candidate
+    # Allow program as bare name e.g. md5sum.c
+    hit = _program_index(str(workspace_root)).get(p.name)
+    if hit is not None:
+        return Path(hit)
+    return (workspace_root / program).resolve()
+
 
 def get_programs_from_result_llm(results_dir: Path) -> List[Tuple[str, str]]:
     """
     Discover programs from result/llm/*_inputs.json.
     Returns sorted list of (report_name, util_name) where util_name is the binary name to run.
     """
+    try:
+        mtime_ns = results_dir.stat().st_mtime_ns
+    except OSError:
+        return []
     if not results_dir.is_dir():
         return []
+    return list(_programs_cached(str(results_dir.resolve()), mtime_ns))
+
+
+@lru_cache(maxsize=None)
+def _programs_cached(results_dir: str, mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    """Glob behind get_programs_from_result_llm; the directory mtime in the key changes when files are added or removed."""
     out = []
-    for p in results_dir.glob("*_inputs.json"):
+    for p in Path(results_dir).glob("*_inputs.json"):
         report_name = p.stem.removesuffix("_inputs")
         util_name = REPORT_NAME_TO_UTIL.get(report_name, report_name)
         out.append((report_name, util_name))
     out.sort(key=lambda x: x[0])
-    return out
+    return tuple(out)
 
 
 def load_inputs_from_json(results_dir: Path, report_name: str) -> List[str]:
     """Load input list from result/llm/<report_name>_inputs.json. Return [] if missing or invalid."""
     path = results_dir / f"{report_name}_inputs.json"
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return []
+    return list(_load_inputs_cached(str(path), st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=None)
+def _load_inputs_cached(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Parsed inputs of one _inputs.json, keyed by (path, mtime, size) so rewritten files are re-read."""
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
         if isinstance(data, list):
-            return [str(x) for x in data]
+            return tuple(str(x) for x in data)
     except (json.JSONDecodeError, OSError):
         pass
-    return []
+    return ()
+
+
+def _split_input(inp_str: str) -> List[str]:
+    """shlex.split(inp_str), skipping the shlex tokenizer for inputs that need no shell-style parsing."""
+    if _SHLEX_SPECIAL_CHARS.isdisjoint(inp_str):
+        return inp_str.split()
+    return shlex.split(inp_str)
 
 
 def _arg_safe_for_filename(arg: str, max_len: int = 80) -> str:
     """Sanitize an argument string for use in a filename (alphanumeric, underscore)."""
-    s = re.sub(r"[^a-zA-Z0-9._-]", "_", arg)
-    s = re.sub(r"_+", "_", s).strip("_")
+    if arg.isascii():
+        s = arg.translate(_SAFE_FILENAME_TABLE)
+    else:
+        s = _UNSAFE_FILENAME_CHARS_RE.sub("_", arg)
+    if "__" in s:
+        s = _UNDERSCORE_RUN_RE.sub("_", s)
+    s = s.strip("_")
     return s[:max_len] if s else "empty"
 
 
-def _find_recent_gcda_files(obj_gcov_src: Path, within_seconds: float = 2.0) -> List[Path]:
-    """Return .gcda files under obj_gcov_src modified in the last within_seconds."""
-    now = time.time()
-    out = []
-    for p in obj_gcov_src.rglob("*.gcda"):
-        try:
-            if now - p.stat().st_mtime <= within_seconds:
-                out.append(p)
-        except OSError:
-            pass
-    return out
+def _scan_gcda_entries(root: str):
+    """Yield os.DirEntry for every .gcda file under root (recursive, symlinks not followed)."""
+    try:
+        it = os.scandir(root)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.name.endswith(".gcda"):
+                yield entry
+                continue
+            try:
+                # d_type from readdir; no stat call on Linux
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                yield from _scan_gcda_entries(entry.path)
+
+
+def _find_gcda_files(slot_src: str) -> List[str]:
+    """Return the paths of all .gcda files under slot_src."""
+    return [entry.path for entry in _scan_gcda_entries(slot_src)]
+
+
+def _gcov_prefix_env(slot: Path) -> dict:
+    """
+    Environment that makes gcov-instrumented binaries write .gcda under slot instead of obj-gcov:
+    <obj-gcov>/src/x.gcda -> <slot>/src/x.gcda. Lets several inputs run the same binary at once.
+    """
+    env = os.environ.copy()
+    env["GCOV_PREFIX"] = str(slot)
+    env["GCOV_PREFIX_STRIP"] = str(len(OBJ_GCOV_TOP.parts) - 1)
+    return env
+
 
+class _InputSlot(NamedTuple):
+    """A worker's private .gcda/.gcov directory for run_coverage_for_util, with its per-slot state."""
+    path: Path
+    src: str  # obj-gcov/src counterpart inside the slot
+    env: dict  # _gcov_prefix_env(path)
+    linked_gcno: set  # .gcda paths whose .gcno is already symlinked into src
 
-def _run_gcov_for_gcda(gcda_path: Path, obj_gcov_top: Path, obj_gcov_src: Path) -> None:
-    """Run gcov for one .gcda (base = path relative to obj_gcov_src without .gcda)."""
+
+def _link_gcno_for_gcda(gcda_path: str, slot_src: str) -> None:
+    """Symlink the .gcno matching a slot .gcda (a path under slot_src) from obj-gcov/src, for gcov."""
+    base = gcda_path[: -len(".gcda")]
     try:
-        base = gcda_path.relative_to(obj_gcov_src).with_suffix("")
-        base_str = str(base).replace("\\", "/")
-        subprocess.run(
-            ["gcov", "-o", "src", base_str],
+        os.symlink(f"{OBJ_GCOV_DIR}{base[len(slot_src):]}.gcno", base + ".gcno")
+    except OSError:
+        pass  # already linked
+
+
+def _run_gcov_for_gcdas(gcda_paths: List[str], obj_gcov_top: Path) -> str:
+    """
+    Run one gcov over all given .gcda files with --stdout: the reports are returned concatenated
+    instead of written as .gcov files. gcov runs in obj_gcov_top so that source paths recorded
+    relative to it (e.g. ../src/cat.c) resolve wherever the .gcda files are; each .gcda needs its
+    .gcno next to it.
+    """
+    if not gcda_paths:
+        return ""
+    try:
+        r = subprocess.run(
+            ["gcov", "--stdout", *(p[: -len(".gcda")] for p in gcda_paths)],
             cwd=str(obj_gcov_top),
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=60,
         )
     except Exception:
-        pass
+        return ""
+    return r.stdout.decode("utf-8", errors="replace")
+
+
+def _decode_output(data: bytes) -> str:
+    """Decode captured program output for the report, with text-mode newline handling (\r\n, \r -> \n)."""
+    if not data:
+        return ""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """
+    Create/overwrite path with data using plain open/write/close (no buffered file object, no
+    fstat/isatty calls); used for the many small per-input coverage reports.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _split_gcov_stdout(text: str) -> List[Tuple[str, str]]:
+    """
+    Split concatenated gcov --stdout output into (gcov file name, report) pairs. Each report starts
+    with its "-:    0:Source:<path>" line; the name is what gcov would have written (<basename>.gcov).
+    """
+    out: List[Tuple[str, str]] = []
+    name = None
+    chunk: List[str] = []
+    for line in text.splitlines(keepends=True):
+        count, _, rest = line.partition(":")
+        if count.strip() == "-" and rest.lstrip().startswith("0:Source:"):
+            if name is not None:
+                out.append((name, "".join(chunk)))
+            name = os.path.basename(rest.split("Source:", 1)[1].rstrip("\r\n")) + ".gcov"
+            chunk = []
+        chunk.append(line)
+    if name is not None:
+        out.append((name, "".join(chunk)))
+    return out
 
 
 def run_coverage_for_util(
@@ -105,12 +289,15 @@ def run_coverage_for_util(
     inputs_list: list,
     results_dir: Path,
     timeout_per_run: float = 30.0,
+    jobs: Optional[int] = None,
 ) -> bool:
     """
     Run the utility with each generated input and save reports.
     Prefers gcov binary (obj-gcov/src/<util>); otherwise runs system binary
     and saves stdout. Writes result/<util>_symbolic.txt. When gcov is available,
     also runs gcov per input and saves reports to result/<util>_symbolic_coverage/.
+    Inputs run `jobs` at a time (default: CPU count); each worker writes its .gcda/.gcov into
+    a private slot directory (GCOV_PREFIX), so concurrent runs never share a .gcda file.
     """
     if not inputs_list:
         return True
@@ -120,81 +307,149 @@ def run_coverage_for_util(
     cwd = str(OBJ_GCOV_DIR if use_gcov else workspace_root)
     binary = str(gcov_bin) if use_gcov else util_name
     report_name = UTIL_TO_REPORT_NAME.get(util_name, util_name)  # for coverage_dir / out_file naming
-    gcda_base = UTIL_TO_GCOV_BASE.get(util_name, util_name)
-    report_lines = []
+    # Utilities whose .gcda name differs from the binary ("[" -> lbracket.gcda) only check that file.
+    fixed_gcda = f"{os.sep}{UTIL_TO_GCOV_BASE[util_name]}.gcda" if util_name in UTIL_TO_GCOV_BASE else None
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(inputs_list)))
 
     coverage_dir: Optional[Path] = None
     if use_gcov:
         coverage_dir = results_dir / f"{report_name}_symbolic_coverage"
         coverage_dir.mkdir(parents=True, exist_ok=True)
+        coverage_prefix = f"{coverage_dir}{os.sep}"
+    # Once one run (in this or an earlier call) has produced .gcda files, later runs only check
+    # those paths (kept as "/<path relative to the slot src>") instead of scanning the slot.
+    gcda_key: Optional[Tuple[str, int]] = None
+    if use_gcov:
+        try:
+            gcda_key = (str(gcov_bin), gcov_bin.stat().st_mtime_ns)
+        except OSError:
+            pass
 
-    for i, inp in enumerate(inputs_list):
-        inp_str = str(inp).strip()
-        test_num = i + 1
-
-        if use_gcov:
-            gcda_path = OBJ_GCOV_DIR / f"{gcda_base}.gcda"
-            if gcda_path.exists():
-                gcda_path.unlink()
+    # Per-input columns, computed once up front; workers only index them.
+    inp_strs = [str(inp).strip() for inp in inputs_list]
+    dest_prefixes = [
+        f"test{test_num:06d}_arg_{_arg_safe_for_filename(inp_str)}_"
+        for test_num, inp_str in enumerate(inp_strs, 1)
+    ] if coverage_dir is not None else []
+    # LLM input lists often repeat an input; only its first occurrence is run.
+    first_index: Dict[str, int] = {}
+    duplicate_of = [first_index.setdefault(inp_str, i) for i, inp_str in enumerate(inp_strs)]
+    # argv tail per distinct input (or the ValueError shlex raised, reported in that input's section)
+    split_args: Dict[int, object] = {}
+    for i in first_index.values():
+        try:
+            split_args[i] = _split_input(inp_strs[i])
+        except ValueError as e:
+            split_args[i] = e
 
+    def run_input(i: int, slot: Optional[_InputSlot]) -> List[str]:
+        inp_str = inp_strs[i]
+        test_num = i + 1
+        lines = []
+        env = slot.env if slot is not None else None
         try:
-            args = shlex.split(inp_str) if inp_str else []
+            args = split_args[i]
+            if isinstance(args, ValueError):
+                raise args
             cmd = [binary] + args
             result = subprocess.run(
                 cmd,
                 cwd=cwd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 timeout=timeout_per_run,
+                env=env,
             )
-            report_lines.append(f"=== input {test_num}: {inp_str!r} -> {cmd!r} ===")
-            report_lines.append(result.stdout or "")
+            lines.append(f"=== input {test_num}: {inp_str!r} -> {cmd!r} ===")
+            lines.append(_decode_output(result.stdout))
             if result.stderr:
-                report_lines.append("stderr: " + result.stderr)
+                lines.append("stderr: " + _decode_output(result.stderr))
         except subprocess.TimeoutExpired:
-            report_lines.append(f"=== input {test_num}: {inp_str!r} === (timeout)")
+            lines.append(f"=== input {test_num}: {inp_str!r} === (timeout)")
         except Exception as e:
-            report_lines.append(f"=== input {test_num}: {inp_str!r} === error: {e}")
-
-        if use_gcov and coverage_dir is not None:
-            arg_safe = _arg_safe_for_filename(inp_str)
-            gcov_processed = False
-            if util_name in UTIL_TO_GCOV_BASE:
-                gcda_path = OBJ_GCOV_DIR / f"{gcda_base}.gcda"
-                if gcda_path.exists():
-                    try:
-                        _run_gcov_for_gcda(gcda_path, OBJ_GCOV_TOP, OBJ_GCOV_DIR)
-                        gcov_processed = True
-                    finally:
-                        try:
-                            gcda_path.unlink()
-                        except OSError:
-                            pass
+            lines.append(f"=== input {test_num}: {inp_str!r} === error: {e}")
+
+        if slot is None or coverage_dir is None:
+            return lines
+        # Plain strings from here on: this runs once per input, and os.path/str operations
+        # avoid building Path objects for every .gcda.
+        slot_src = slot.src
+        exists = os.path.exists
+        known_gcda = _KNOWN_GCDA.get(gcda_key) if gcda_key is not None else None
+        if fixed_gcda is not None:
+            run_gcda = [p for p in [slot_src + fixed_gcda] if exists(p)]
+        elif known_gcda:
+            run_gcda = [p for p in [slot_src + rel for rel in known_gcda] if exists(p)]
+        else:
+            run_gcda = _find_gcda_files(slot_src)
+            if run_gcda and gcda_key is not None:
+                with _KNOWN_GCDA_LOCK:
+                    _KNOWN_GCDA.setdefault(gcda_key, frozenset(p[len(slot_src):] for p in run_gcda))
+        if not run_gcda:
+            return lines
+        linked = slot.linked_gcno
+        for gcda_path in run_gcda:
+            if gcda_path not in linked:
+                _link_gcno_for_gcda(gcda_path, slot_src)
+                linked.add(gcda_path)
+        gcov_text = _run_gcov_for_gcdas(run_gcda, OBJ_GCOV_TOP)
+        dest_prefix = dest_prefixes[i]
+        for gcda_path in run_gcda:
+            try:
+                os.unlink(gcda_path)
+            except OSError:
+                pass
+        for gcov_name, report in _split_gcov_stdout(gcov_text):
+            if not gcov_name.endswith(".c.gcov"):
+                continue  # only save coverage for .c sources, not .h etc.
+            try:
+                _write_file(f"{coverage_prefix}{dest_prefix}{gcov_name}.txt", report.encode("utf-8"))
+            except Exception:
+                pass
+        return lines
+
+    with ExitStack() as stack:
+        # One slot per worker, on tmpfs when available: the .gcda of every run is created, read
+        # once by gcov and deleted, so it never needs to reach the disk.
+        slots = queue.SimpleQueue()
+        slot_parent = _SLOT_PARENT if os.access(_SLOT_PARENT, os.W_OK) else OBJ_GCOV_TOP.parent
+        for _ in range(jobs):
+            if use_gcov:
+                slot_path = Path(stack.enter_context(tempfile.TemporaryDirectory(
+                    prefix=f"obj-gcov-input-{report_name}-", dir=slot_parent
+                )))
+                slot = _InputSlot(
+                    slot_path,
+                    str(slot_path / OBJ_GCOV_DIR.relative_to(OBJ_GCOV_TOP)),
+                    _gcov_prefix_env(slot_path),
+                    set(),
+                )
             else:
-                recent = _find_recent_gcda_files(OBJ_GCOV_DIR, within_seconds=2.0)
-                for gcda_path in recent:
-                    _run_gcov_for_gcda(gcda_path, OBJ_GCOV_TOP, OBJ_GCOV_DIR)
-                    try:
-                        gcda_path.unlink()
-                    except OSError:
-                        pass
-                    gcov_processed = True
-            if gcov_processed:
-                for gcov_path in OBJ_GCOV_TOP.rglob("*.gcov"):
-                    if not gcov_path.stem.endswith(".c"):
-                        continue  # only save coverage for .c sources, not .h etc.
-                    try:
-                        rel = gcov_path.relative_to(OBJ_GCOV_TOP)
-                        dest_name = f"test{test_num:06d}_arg_{arg_safe}_{rel.as_posix().replace('/', '_')}.txt"
-                        dest = coverage_dir / dest_name
-                        dest.write_text(
-                            gcov_path.read_text(encoding="utf-8", errors="replace")
-                        )
-                    except Exception:
-                        pass
-
-    out_file = results_dir / f"{report_name}_symbolic.txt"
-    out_file.write_text("\n".join(report_lines), encoding="utf-8")
+                slot = None
+            slots.put(slot)
+
+        def task(i: int) -> List[str]:
+            first = duplicate_of[i]
+            if first != i:
+                return [f"=== input {i + 1}: {inp_strs[i]!r} === (duplicate of input {first + 1})"]
+            slot = slots.get()
+            try:
+                return run_input(i, slot)
+            finally:
+                slots.put(slot)
+
+        # Each input's section is written as soon as it and all earlier inputs are done (ex.map
+        # yields in input order), so only out-of-order finished sections are held in memory.
+        out_file = results_dir / f"{report_name}_symbolic.txt"
+        with ThreadPoolExecutor(max_workers=jobs) as ex, open(
+            out_file, "w", encoding="utf-8", buffering=1 << 16
+        ) as f:
+            sep = ""
+            for lines in ex.map(task, range(len(inp_strs))):
+                for line in lines:
+                    f.write(sep)
+                    f.write(line)
+                    sep = "\n"
     return True
 
 
@@ -213,6 +468,13 @@ def main():
         action="store_true",
         help="After generating coverage, run coverage_aggregate to merge .gcov (requires lcov/gcovr)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of inputs to run in parallel per util (default: CPU count)",
+    )
     args = parser.parse_args()
 
     workspace_root = WORKSPACE_ROOT
@@ -239,7 +501,7 @@ def main():
             continue
         print(f"=== {report_name} ===")
         print(f"  Loaded {len(inputs_list)} inputs from {report_name}_inputs.json")
-        ok = run_coverage_for_util(workspace_root, util_name, inputs_list, results_dir)
+        ok = run_coverage_for_util(workspace_root, util_name, inputs_list, results_dir, jobs=args.jobs)
         if ok:
             print(f"  -> {results_dir / (report_name + '_symbolic.txt')}")
             coverage_dir = results_dir / f"{report_name}_symbolic_coverage"
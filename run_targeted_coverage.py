@@ -5,17 +5,27 @@ and aggregate/compare with previous coverage.
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
-
-from run_symbolic_executor import run_coverage_for_util, UTIL_TO_REPORT_NAME, get_programs_from_result_llm
+from typing import List, Optional, Tuple
+
+from run_symbolic_executor import (
+    OBJ_GCOV_DIR,
+    UTIL_TO_REPORT_NAME,
+    get_programs_from_result_llm,
+    resolve_program_path,
+    run_coverage_for_util,
+)
 from coverage_aggregate import (
     aggregate_directories,
+    cached_merged_info,
     discover_coverage_dirs,
+    get_lcov_line_coverage_pct,
     get_merged_line_coverage_pct,
 )
 
@@ -27,25 +37,6 @@ DEFAULT_MERGED_COVERAGE = WORKSPACE_ROOT / "result" / "llm" / "merged-coverage"
 # Map source file stem to executable name (for special cases like lbracket.c -> "[")
 REPORT_NAME_TO_UTIL = {v: k for k, v in UTIL_TO_REPORT_NAME.items()}
 
-
-def resolve_program_path(program: str, workspace_root: Path) -> Path:
-    """Resolve program to an absolute path. Tries coreutils src, then coreutils-6.11."""
-    p = Path(program)
-    if p.is_absolute() and p.exists():
-        return p
-    if p.exists():
-        return p.resolve()
-    for base in ("coreutils/coreutils-8.32/src", "coreutils/coreutils-6.11/src"):
-        candidate = workspace_root / base / program
-        if candidate.exists():
-            return candidate
-    for base in ("coreutils/coreutils-8.32/src", "coreutils/coreutils-6.11/src"):
-        candidate = workspace_root / base / p.name
-        if candidate.exists():
-            return candidate
-    return (workspace_root / program).resolve()
-
-
 def source_stem_to_util(stem: str) -> str:
     """Derive executable/util name from source file stem (e.g. lbracket -> '[', md5sum -> md5sum)."""
     return REPORT_NAME_TO_UTIL.get(stem, stem)
@@ -68,6 +59,41 @@ def infer_previous_results_dir(cumulative_path: Path, workspace_root: Path) -> O
     return None
 
 
+def inputs_signature(inputs_bytes: bytes, util_name: str) -> str:
+    """
+    BLAKE2b digest of a targeted inputs file's bytes, the util name and the util's gcov binary
+    (mtime and size, so a rebuilt obj-gcov invalidates it). Used to skip unchanged programs in --all.
+    """
+    h = hashlib.blake2b(inputs_bytes, digest_size=16)
+    h.update(b"\0" + util_name.encode("utf-8"))
+    try:
+        st = (OBJ_GCOV_DIR / util_name).stat()
+        h.update(f"\0{st.st_mtime_ns}\0{st.st_size}".encode("ascii"))
+    except OSError:
+        pass
+    return h.hexdigest()
+
+
+def compute_before_after_pct(
+    previous_dirs: List[Path],
+    new_dirs: List[Path],
+    workspace_root: Path,
+    output_merged: Path,
+) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Return (before, after) line coverage percentages for previous_dirs and previous_dirs + new_dirs.
+    The merged .info of previous_dirs is cached in output_merged (reused while they are unchanged),
+    so After only adds the new dirs to it instead of re-converting the previous ones.
+    """
+    before_info = cached_merged_info(previous_dirs, workspace_root, output_merged) if previous_dirs else None
+    if before_info is None:
+        # Nothing merged for Before (no previous reports, or lcov missing): After covers all dirs.
+        return None, get_merged_line_coverage_pct(list(previous_dirs) + new_dirs, workspace_root, output_merged)
+    before_pct = get_lcov_line_coverage_pct(before_info)
+    after_pct = get_merged_line_coverage_pct(new_dirs, workspace_root, output_merged, base_info=before_info)
+    return before_pct, after_pct
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Run targeted inputs for coverage and compare results"
@@ -131,7 +157,20 @@ def main() -> None:
         default="manual",
         help="Suffix for output directory (targeted_uncovered_{util}_{suffix}). Default: manual.",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Total parallel runs; with --all, split between programs and their inputs (default: CPU count)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --all, rerun programs whose targeted inputs are unchanged since their last coverage run.",
+    )
     args = parser.parse_args()
+    jobs = max(1, args.jobs)
 
     workspace_root = WORKSPACE_ROOT
     results_parent = (workspace_root / args.results_dir) if args.results_dir else DEFAULT_RESULT_DIR
@@ -166,34 +205,66 @@ def main() -> None:
             if not inputs_path.exists():
                 continue
             try:
-                with open(inputs_path, "r", encoding="utf-8") as f:
-                    inputs_list = json.load(f)
+                inputs_bytes = inputs_path.read_bytes()
+                inputs_list = json.loads(inputs_bytes)
                 if not isinstance(inputs_list, list):
                     continue
             except Exception:
                 continue
-            to_run.append((report_name, util_name, inputs_list))
+            to_run.append((report_name, util_name, inputs_list, inputs_signature(inputs_bytes, util_name)))
         if not to_run:
             print("No programs with both *_inputs.json and *_targeted_inputs.json found.", file=sys.stderr)
             sys.exit(1)
-        new_dirs = []
-        for report_name, util_name, inputs_list in to_run:
+
+        # Programs whose inputs (and gcov binary) match the signature stored after their last
+        # successful run keep their existing coverage dir instead of being rerun.
+        sig_dir = results_parent / ".cache"
+        cov_dirs = [
+            results_parent / f"targeted_uncovered_{report_name}_{model_safe}" / f"{report_name}_symbolic_coverage"
+            for report_name, _, _, _ in to_run
+        ]
+        sig_paths = [sig_dir / f"{report_name}_{model_safe}.sig" for report_name, _, _, _ in to_run]
+        pending = []
+        for i, (report_name, _, _, sig) in enumerate(to_run):
+            try:
+                unchanged = not args.force and cov_dirs[i].is_dir() and sig_paths[i].read_text(encoding="ascii") == sig
+            except OSError:
+                unchanged = False
+            if unchanged:
+                print(f"Skipping {report_name} (targeted inputs unchanged; --force to rerun)", file=sys.stderr)
+            else:
+                pending.append(i)
+        # Programs are independent (each input runs in its own GCOV_PREFIX slot), so run them
+        # concurrently and split the jobs budget between programs and their inputs.
+        program_jobs = max(1, min(jobs, len(pending)))
+        input_jobs = max(1, jobs // program_jobs)
+
+        def run_program(i: int) -> bool:
+            report_name, util_name, inputs_list, sig = to_run[i]
             print(f"Running targeted coverage: {report_name} ({len(inputs_list)} inputs)...", file=sys.stderr)
-            new_parent = results_parent / f"targeted_uncovered_{report_name}_{model_safe}"
-            new_parent.mkdir(parents=True, exist_ok=True)
-            ok = run_coverage_for_util(workspace_root, util_name, inputs_list, new_parent)
-            if ok:
-                cov_dir = new_parent / f"{report_name}_symbolic_coverage"
-                if cov_dir.exists():
-                    new_dirs.append(cov_dir)
+            cov_dir = cov_dirs[i]
+            cov_dir.parent.mkdir(parents=True, exist_ok=True)
+            # Drop the old signature first so an interrupted run is not mistaken for a finished one.
+            sig_paths[i].unlink(missing_ok=True)
+            ok = run_coverage_for_util(workspace_root, util_name, inputs_list, cov_dir.parent, jobs=input_jobs)
+            if not (ok and cov_dir.exists()):
+                return False
+            try:
+                sig_dir.mkdir(parents=True, exist_ok=True)
+                sig_paths[i].write_text(sig, encoding="ascii")
+            except OSError:
+                pass
+            return True
+
+        with ThreadPoolExecutor(max_workers=program_jobs) as ex:
+            failed = {i for i, ok in zip(pending, ex.map(run_program, pending)) if not ok}
+        new_dirs = [d for i, d in enumerate(cov_dirs) if i not in failed and d.exists()]
         if not new_dirs:
             print("No coverage dirs produced.", file=sys.stderr)
             sys.exit(1)
         after_dirs = list(previous_dirs) + new_dirs
         print("Calculating Before/After coverage...", file=sys.stderr)
-        with tempfile.TemporaryDirectory(prefix="agg_before_") as tmp_before:
-            before_pct = get_merged_line_coverage_pct(previous_dirs, workspace_root, Path(tmp_before))
-        after_pct = get_merged_line_coverage_pct(after_dirs, workspace_root, output_merged)
+        before_pct, after_pct = compute_before_after_pct(previous_dirs, new_dirs, workspace_root, output_merged)
         aggregate_ok = aggregate_directories(
             after_dirs, workspace_root, output_merged, use_lcov=True, use_gcovr=True
         )
@@ -256,7 +327,7 @@ def main() -> None:
     new_parent = results_parent / f"targeted_uncovered_{report_name}_{model_safe}"
     new_parent.mkdir(parents=True, exist_ok=True)
 
-    ok = run_coverage_for_util(workspace_root, util_name, inputs_list, new_parent)
+    ok = run_coverage_for_util(workspace_root, util_name, inputs_list, new_parent, jobs=jobs)
     if not ok:
         sys.exit(1)
 
@@ -265,23 +336,10 @@ def main() -> None:
         print(f"Warning: expected coverage dir not found: {new_coverage_dir}", file=sys.stderr)
     print(f"New coverage reports saved to: {new_coverage_dir}")
 
-    print("Calculating 'Before' coverage...", file=sys.stderr)
-    with tempfile.TemporaryDirectory(prefix="agg_before_") as tmp_before:
-        before_pct = get_merged_line_coverage_pct(
-            previous_dirs,
-            workspace_root,
-            Path(tmp_before),
-        )
-
-    print("Calculating 'After' coverage...", file=sys.stderr)
-    after_dirs = list(previous_dirs)
-    if new_coverage_dir.exists():
-        after_dirs.append(new_coverage_dir)
-    after_pct = get_merged_line_coverage_pct(
-        after_dirs,
-        workspace_root,
-        output_merged,
-    )
+    print("Calculating 'Before' and 'After' coverage...", file=sys.stderr)
+    new_dirs = [new_coverage_dir] if new_coverage_dir.exists() else []
+    after_dirs = list(previous_dirs) + new_dirs
+    before_pct, after_pct = compute_before_after_pct(previous_dirs, new_dirs, workspace_root, output_merged)
 
     aggregate_ok = aggregate_directories(
         after_dirs,
@@ -5,11 +5,21 @@ Used by run_symbolic_executor.py; no file I/O or coverage logic here.
 
 import ast
 import json
-from typing import List
+import re
+from typing import List, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from prompt import prompt_symbolic_executor
 from openai_client import OpenAIClient
 
+# A response wrapped in a markdown fence: the opening ``` line is dropped, and so is a last line
+# holding only the closing ```.
+_FENCE_RE = re.compile(r"```[^\n]*(.*?)(?:\n[^\S\n]*```[^\S\n]*)?\Z", re.DOTALL)
+
 
 def parse_response_list(response: str) -> List[str]:
     """
@@ -17,28 +27,38 @@ def parse_response_list(response: str) -> List[str]:
     Handles JSON list, Python literal list, and strips markdown.
     """
     s = (response or "").strip()
-    if s.startswith("```"):
-        lines = s.split("\n")
-        lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        s = "\n".join(lines)
+    if s[:3] == "```":
+        s = _FENCE_RE.match(s).group(1)
     s = s.strip()
+    if not s:
+        return []
+    # Only text starting with "[" can decode to a list; anything else is a single raw input.
+    if s[0] != "[":
+        return [s]
+    if orjson is not None:
+        # Fast path for the usual list of strings. Anything else goes through json.loads, which
+        # also accepts NaN/Infinity and keeps integers beyond 64 bits exact (orjson makes them floats).
+        try:
+            out = orjson.loads(s)
+        except orjson.JSONDecodeError:
+            out = None
+        if isinstance(out, list) and all(type(x) is str for x in out):
+            return out
     try:
         out = json.loads(s)
         if isinstance(out, list):
             return [str(x) for x in out]
+        return [s]
     except json.JSONDecodeError:
         pass
+    # Python-style lists (single quotes, trailing commas) only after JSON has failed.
     try:
         out = ast.literal_eval(s)
         if isinstance(out, list):
             return [str(x) for x in out]
-    except (ValueError, SyntaxError):
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
         pass
-    if s:
-        return [s]
-    return []
+    return [s]
 
 
 def get_inputs_for_program(
@@ -48,18 +68,41 @@ def get_inputs_for_program(
     max_tokens: int = 1024,
     temperature: float = 0.3,
     timeout: float = 300.0,
+    no_cache: bool = False,
 ) -> List[str]:
     """
     Send program source + symbolic-executor prompt to the LLM; return parsed list of inputs.
+    Pass temperature=0 for a deterministic answer that the client can serve from its cache.
     """
     full_prompt = program_content + "\n\n" + prompt_symbolic_executor
-    response = client.chat(
+    # Stream the answer and stop as soon as it holds a complete JSON list; anything the model
+    # writes after the list (closing fence, commentary) is not needed.
+    text = "".join(client.chat_stream(
         full_prompt,
         max_tokens=max_tokens,
         temperature=temperature,
         timeout=timeout,
-    )
-    return parse_response_list((response or "").strip())
+        no_cache=no_cache,
+        stop=lambda text, piece: "]" in piece and _complete_json_list(text) is not None,
+    ))
+    inputs = _complete_json_list(text)
+    return inputs if inputs is not None else parse_response_list(text.strip())
+
+
+def _complete_json_list(text: str) -> Optional[List[str]]:
+    """Return the inputs if text (optionally after an opening ``` fence) is already a full JSON list."""
+    s = text.strip()
+    if s[:3] == "```":
+        s = s.partition("\n")[2].strip()
+        if s.endswith("```"):
+            s = s[:-3].rstrip()
+    if s[:1] != "[" or s[-1:] != "]":
+        return None
+    try:
+        out = json.loads(s)
+    except json.JSONDecodeError:
+        return None
+    return [str(x) for x in out] if isinstance(out, list) else None
 
 
 if __name__ == "__main__":
@@ -80,6 +123,22 @@ if __name__ == "__main__":
         default=2,
         help="Max number of .c files to process (default: 2); use 0 for all",
     )
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=0.3,
+        help="Sampling temperature (default: 0.3; use 0 for deterministic, cached answers)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the LLM response cache (~/.cache/klee-llm)",
+    )
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="Also reuse answers to near-identical earlier prompts (embedding similarity; temperature 0 only)",
+    )
     args = parser.parse_args()
 
     if not _src_dir.is_dir():
@@ -94,7 +153,7 @@ if __name__ == "__main__":
         sys.exit(1)
 
     try:
-        client = OpenAIClient()
+        client = OpenAIClient(use_cache=not args.no_cache, enable_semantic_cache=args.semantic_cache)
     except Exception as e:
         print(f"OpenAI client error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -108,7 +167,7 @@ if __name__ == "__main__":
         print(f"=== {rel} ===")
         try:
             program_content = path.read_text(encoding="utf-8", errors="replace")
-            inputs_list = get_inputs_for_program(program_content, client)
+            inputs_list = get_inputs_for_program(program_content, client, temperature=args.temperature)
         except Exception as e:
             print(f"  Error: {e}", file=sys.stderr)
             continue